@@ -7,11 +7,15 @@ Alpha Factor Model (single-file)
 - Computes daily returns and basic performance metrics + plot
 """
 import os
+import sys
 import numpy as np
 import pandas as pd
-import yfinance as yf
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
+
 TICKERS = ["AAPL","MSFT","GOOGL","AMZN","TSLA"]
 START = "2022-01-01"
 END = None  # None -> up to today
@@ -19,24 +23,24 @@ OUTPUT = "reports"
 os.makedirs(OUTPUT, exist_ok=True)
 
 def download_close(tickers):
-    data = {}
-    for t in tickers:
-        df = yf.download(t, start=START, end=END, progress=False)
-        data[t] = df['Close']
-    prices = pd.concat(data, axis=1)
-    prices.columns = tickers
+    prices = PriceStore().load_close(tickers, start=START, end=END)
+    prices = prices.reindex(columns=tickers)
     return prices.dropna(how='all')
 
+def daily_returns(prices):
+    # shared panel: computed once per price version, NaN rows kept and aligned to prices
+    return returns_panel(prices).simple_frame(dropna=False).reindex(prices.index)
+
 def compute_factors(prices):
     # momentum: past 60 trading days return
     mom = prices.pct_change(60).shift(1)
     # volatility: past 60-day std
-    vol = prices.pct_change().rolling(60).std().shift(1)
+    vol = daily_returns(prices).rolling(60).std().shift(1)
     return mom, vol
 
 def rank_and_construct(prices, mom):
     # resample monthly: on last business day of month
-    rets = prices.pct_change().dropna()
+    rets = returns_panel(prices).simple_frame()
     monthly_idx = prices.resample('M').last().index
     positions = pd.DataFrame(index=rets.index, columns=prices.columns).fillna(0.0)
     for dt in monthly_idx:
@@ -61,7 +65,7 @@ def rank_and_construct(prices, mom):
     return positions
 
 def backtest(positions, prices):
-    rets = prices.pct_change().fillna(0)
+    rets = daily_returns(prices).fillna(0)
     strat_rets = (positions.shift(1) * rets).sum(axis=1)
     cum = (1+strat_rets).cumprod()
     return strat_rets, cum
@@ -4,12 +4,14 @@ Risk Parity + Vol Target (single-file)
 - Vol targeting to target_vol annualized
 - Backtests simple daily returns
 """
-import os, math
+import os, sys, math
 import numpy as np
-import pandas as pd
-import yfinance as yf
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
+
 TICKERS=["AAPL","MSFT","GOOGL"]
 START="2022-01-01"
 OUTPUT="reports"
@@ -17,12 +19,7 @@ TARGET_VOL=0.12
 os.makedirs(OUTPUT, exist_ok=True)
 
 def download_close(tickers):
-    data={}
-    for t in tickers:
-        df=yf.download(t,start=START,progress=False)
-        data[t]=df['Close']
-    prices=pd.concat(data,axis=1).dropna()
-    prices.columns=tickers
+    prices=PriceStore().load_close(tickers,start=START).reindex(columns=tickers).dropna()
     return prices
 
 def inv_vol_weights(returns, window=60):
@@ -41,7 +38,7 @@ def apply_vol_target(weights, returns, target=TARGET_VOL):
 
 def main():
     prices = download_close(TICKERS)
-    rets = prices.pct_change().dropna()
+    rets = returns_panel(prices).simple_frame()
     w = inv_vol_weights(rets)
     print("Weights (risk-parity approx):", {k:round(v,4) for k,v in zip(TICKERS,w)})
     strat_rets, scale = apply_vol_target(w, rets)
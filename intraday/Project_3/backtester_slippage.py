@@ -5,11 +5,14 @@ Backtester with slippage and transaction cost in one script.
 - Reports P&L, annualized metrics, saves equity curve
 """
 import os
+import sys
 import numpy as np
 import pandas as pd
-import yfinance as yf
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from market_data.store import PriceStore
+
 TICKER="AAPL"
 START="2022-01-01"
 OUTPUT="reports"
@@ -18,7 +21,9 @@ SLIPPAGE=0.0007            # 7 bps slippage per trade
 os.makedirs(OUTPUT, exist_ok=True)
 
 def download(ticker):
-    df = yf.download(ticker, start=START, progress=False)
+    df = PriceStore().load(ticker, start=START).get(ticker)
+    if df is None:
+        raise RuntimeError(f"No data for {ticker}")
     return df['Close'].dropna()
 
 def generate_signals(prices):
@@ -4,27 +4,25 @@ Policy-search portfolio agent (lightweight)
 - Serves as a tiny 'RL-like' experiment without heavy frameworks.
 """
 import os
+import sys
 import numpy as np
-import pandas as pd
-import yfinance as yf
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
+
 TICKERS=["AAPL","MSFT","GOOGL"]
 START="2022-01-01"
 OUTPUT="reports"
 os.makedirs(OUTPUT, exist_ok=True)
 
 def download(tickers):
-    data={}
-    for t in tickers:
-        df=yf.download(t,start=START,progress=False)
-        data[t]=df['Close']
-    prices=pd.concat(data,axis=1).dropna()
-    prices.columns=tickers
+    prices=PriceStore().load_close(tickers,start=START).reindex(columns=tickers).dropna()
     return prices
 
 def return_series(prices):
-    return prices.pct_change().dropna()
+    return returns_panel(prices).simple_frame()
 
 def evaluate(weights, rets):
     port = (rets * weights).sum(axis=1)
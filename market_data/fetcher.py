@@ -0,0 +1,160 @@
+"""
+Concurrent market-data fetcher with pluggable backends.
+
+A backend turns (ticker, start, end, interval) into a normalized OHLCV
+frame. The Fetcher fans a list of tickers out over a bounded thread pool and
+retries failed downloads with exponential backoff, so wall-clock time scales
+with pool size rather than with the number of tickers.
+
+Backends:
+    YahooBackend    live downloads through yfinance
+    FixtureBackend  a local directory of yfinance CSVs, for offline runs
+
+Setting QUANT_LAB_FIXTURES=<dir> makes FixtureBackend the default.
+Progress and failures are reported through the "market_data.fetcher" logger.
+"""
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from market_data.yf_csv import read_yf_csv
+
+FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+log = logging.getLogger(__name__)
+
+
+def normalize_ohlcv(df):
+    """Flatten a yfinance frame to a sorted, tz-naive OHLCV frame."""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=list(FIELDS), dtype=float)
+    df = df.copy()
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    df = df.reindex(columns=list(FIELDS)).astype(float)
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        # keep exchange wall-clock time so daily bars stay on midnight
+        index = index.tz_localize(None)
+    df.index = index.as_unit("ns")
+    df = df[~df.index.isna()]
+    return df[~df.index.duplicated(keep="last")].sort_index()
+
+
+# -------------------------------------------------------
+# Backends
+# -------------------------------------------------------
+
+class YahooBackend:
+    """Live Yahoo Finance downloads (one Ticker object per call, thread-safe)."""
+
+    def fetch(self, ticker, start=None, end=None, interval="1d"):
+        import yfinance as yf
+
+        # without a start yfinance defaults to a one-month period
+        span = {"period": "max"} if start is None else {"start": start}
+        # by default yfinance logs errors (rate limits, bad tickers) and returns
+        # an empty frame; raising lets Fetcher.fetch_one retry them
+        df = yf.Ticker(ticker).history(
+            **span, end=end, interval=interval, auto_adjust=True, raise_errors=True
+        )
+        return normalize_ohlcv(df)
+
+
+class FixtureBackend:
+    """
+    Serve downloads from a directory of yfinance CSVs named <ticker> or
+    <ticker>.csv. Unknown tickers come back empty, like a failed download.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def _path(self, ticker):
+        for name in (ticker, ticker + ".csv"):
+            path = os.path.join(self.root, name)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def fetch(self, ticker, start=None, end=None, interval="1d"):
+        path = self._path(ticker)
+        if path is None:
+            return normalize_ohlcv(None)
+        df = normalize_ohlcv(read_yf_csv(path).to_frame())
+        # same [start, end) convention as yfinance
+        if start is not None:
+            df = df[df.index >= pd.Timestamp(start)]
+        if end is not None:
+            df = df[df.index < pd.Timestamp(end)]
+        return df
+
+
+def default_backend():
+    fixtures = os.environ.get("QUANT_LAB_FIXTURES")
+    return FixtureBackend(fixtures) if fixtures else YahooBackend()
+
+
+# -------------------------------------------------------
+# Fetcher
+# -------------------------------------------------------
+
+class Fetcher:
+    """Bounded thread-pool fetcher with retry and exponential backoff."""
+
+    def __init__(self, backend=None, max_workers=8, retries=3, backoff=0.5):
+        self.backend = backend or default_backend()
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.failures = {}
+
+    def fetch_one(self, ticker, start=None, end=None, interval="1d"):
+        """Fetch one ticker, retrying on exceptions. Re-raises the last error."""
+        for attempt in range(self.retries + 1):
+            try:
+                return self.backend.fetch(ticker, start, end, interval)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def fetch_many(self, tickers, start=None, end=None, interval="1d"):
+        """
+        Fetch tickers concurrently. `start` is either one date for every
+        ticker or a {ticker: start} mapping (used for tail refreshes).
+        Returns {ticker: frame} for non-empty results; tickers that kept
+        failing or came back empty are recorded in self.failures, which
+        holds the last call only (PriceStore.refresh merges its calls).
+        """
+        tickers = list(dict.fromkeys(tickers))
+        self.failures = {}
+        if not tickers:
+            return {}
+        starts = start if isinstance(start, dict) else dict.fromkeys(tickers, start)
+
+        workers = max(1, min(self.max_workers, len(tickers)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                t: pool.submit(self.fetch_one, t, starts.get(t), end, interval) for t in tickers
+            }
+
+        out = {}
+        for t, fut in futures.items():
+            try:
+                df = fut.result()
+            except Exception as exc:
+                self.failures[t] = exc
+                continue
+            if df.empty:
+                self.failures[t] = LookupError(f"no data returned for {t}")
+                continue
+            out[t] = df
+        log.info("Fetched %d/%d tickers (%s, %d workers)",
+                 len(out), len(tickers), type(self.backend).__name__, workers)
+        if self.failures:
+            log.warning("Failed to fetch %s", ", ".join(self.failures))
+        return out
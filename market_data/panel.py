@@ -0,0 +1,112 @@
+"""
+Vectorized calendar alignment for large universes.
+
+align_panel scatters N (dates, values) series onto one master trading
+calendar with a single searchsorted over all observations, instead of
+repeated pd.concat / reindex calls. The result is one contiguous
+(n_dates, n_assets) float64 matrix plus a validity mask of the cells that
+held a real observation before any fill policy was applied.
+
+Fill policies:
+    None     leave missing cells as NaN
+    "ffill"  carry the last observation forward (at most `limit` rows)
+    "zero"   set missing cells to 0.0
+    "drop"   keep only dates observed for every asset (old concat().dropna())
+"""
+import numpy as np
+import pandas as pd
+
+FILL_POLICIES = (None, "ffill", "zero", "drop")
+
+
+class AlignedPanel:
+    """
+    Aligned values (n_dates, n_assets) with observation mask and labels.
+    `version` is an optional cheap identity of the data (set by PriceStore),
+    usable as the returns_panel memo key.
+    """
+
+    def __init__(self, index, columns, values, mask, version=None):
+        self.index = index
+        self.columns = columns
+        self.values = values
+        self.mask = mask
+        self.version = version
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def to_frame(self):
+        return pd.DataFrame(self.values, index=self.index, columns=self.columns, copy=False)
+
+
+def _as_ns(dates):
+    if isinstance(dates, pd.Index):
+        return pd.DatetimeIndex(dates).as_unit("ns").asi8
+    dates = np.asarray(dates)
+    if dates.dtype.kind == "M":
+        return dates.astype("datetime64[ns]").view(np.int64)
+    return dates.astype(np.int64, copy=False)
+
+
+def _forward_fill(values, mask, limit=None):
+    rows = np.arange(values.shape[0])[:, None]
+    last = np.where(mask, rows, -1)
+    np.maximum.accumulate(last, axis=0, out=last)
+    ok = last >= 0
+    if limit is not None:
+        ok &= (rows - last) <= limit
+    filled = np.take_along_axis(values, np.maximum(last, 0), axis=0)
+    filled[~ok] = np.nan
+    return filled
+
+
+def align_panel(series, calendar=None, fill=None, limit=None):
+    """
+    Align a mapping {name: pd.Series | (dates, values)} on one calendar.
+
+    calendar defaults to the union of all observed dates. Observations that
+    fall outside an explicit calendar are discarded.
+    """
+    if fill not in FILL_POLICIES:
+        raise ValueError(f"fill must be one of {FILL_POLICIES}, got {fill!r}")
+
+    names, dates, values = [], [], []
+    for name, s in series.items():
+        if isinstance(s, pd.Series):
+            d, v = s.index, s.to_numpy(dtype=np.float64)
+        else:
+            d, v = s
+        names.append(name)
+        dates.append(_as_ns(d))
+        values.append(np.asarray(v, dtype=np.float64))
+
+    lengths = np.array([len(d) for d in dates], dtype=np.int64)
+    all_dates = np.concatenate(dates) if dates else np.empty(0, np.int64)
+    all_values = np.concatenate(values) if values else np.empty(0)
+    cols = np.repeat(np.arange(len(names)), lengths)
+
+    if calendar is None:
+        cal = np.unique(all_dates)
+    else:
+        cal = np.unique(_as_ns(calendar))
+
+    # one searchsorted / scatter pass over every observation of every asset
+    pos = np.searchsorted(cal, all_dates)
+    hit = pos < len(cal)
+    hit[hit] = cal[pos[hit]] == all_dates[hit]
+    out = np.full((len(cal), len(names)), np.nan)
+    out[pos[hit], cols[hit]] = all_values[hit]
+    mask = ~np.isnan(out)
+
+    if fill == "ffill":
+        out = _forward_fill(out, mask, limit)
+    elif fill == "zero":
+        out[~mask] = 0.0
+    elif fill == "drop":
+        keep = mask.all(axis=1)
+        cal, out, mask = cal[keep], np.ascontiguousarray(out[keep]), mask[keep]
+
+    index = pd.DatetimeIndex(cal.view("datetime64[ns]"), name="Date")
+    return AlignedPanel(index, names, out, mask)
@@ -0,0 +1,122 @@
+"""
+Shared returns panel.
+
+Simple and log returns of a price panel are computed once into aligned
+(n_dates - 1, n_assets) matrices and memoized, so every model in a process
+(optimizer, factor model, regime model, backtests) reuses the same arrays
+instead of re-running pct_change().dropna().
+
+The memo key is cheap: an explicit `version` when the caller has one (e.g.
+AlignedPanel.version from PriceStore.load_panel), otherwise the identity of
+the prices frame, held through a weak reference. Frames are treated as
+immutable; a content hash (data_version) is only computed with hash=True.
+
+The matrices are read-only; the DataFrame views handed out wrap them without
+copying.
+"""
+import hashlib
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MAX_CACHED_PANELS = 8
+_PANELS = OrderedDict()
+_BY_FRAME = {}      # id(frame) -> (weakref to frame, {dtype: ReturnsPanel})
+
+
+def data_version(prices):
+    """Content hash of a price panel (index, columns and values)."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(pd.DatetimeIndex(prices.index).asi8).tobytes())
+    h.update(repr(list(prices.columns)).encode())
+    h.update(np.ascontiguousarray(prices.to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+class ReturnsPanel:
+    """
+    Simple and log returns of a price panel.
+
+    Row i holds the return from prices.index[i] to prices.index[i + 1].
+    `valid` flags the rows without NaN in any column; the dropna=True views
+    keep only those rows, matching prices.pct_change().dropna().
+    """
+
+    def __init__(self, prices: pd.DataFrame, dtype=np.float64, version=None):
+        self.version = version
+        self.dtype = np.dtype(dtype)
+        self.index = prices.index[1:]
+        self.columns = prices.columns
+
+        p = prices.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            simple = p[1:] / p[:-1] - 1.0
+            log = np.log1p(simple)
+        self.simple = simple.astype(self.dtype, copy=False)
+        self.log = log.astype(self.dtype, copy=False)
+        self.valid = ~np.isnan(simple).any(axis=1)
+        for arr in (self.simple, self.log, self.valid):
+            arr.setflags(write=False)
+        self._dense = {}
+
+    def _rows(self, name, dropna):
+        values = getattr(self, name)
+        if not dropna or self.valid.all():
+            return values, self.index
+        if name not in self._dense:
+            dense = values[self.valid]
+            dense.setflags(write=False)
+            self._dense[name] = dense
+        return self._dense[name], self.index[self.valid]
+
+    def _frame(self, name, dropna):
+        values, index = self._rows(name, dropna)
+        return pd.DataFrame(values, index=index, columns=self.columns, copy=False)
+
+    def simple_frame(self, dropna=True):
+        return self._frame("simple", dropna)
+
+    def log_frame(self, dropna=True):
+        return self._frame("log", dropna)
+
+
+def _frame_panels(prices):
+    """Per-frame memo, dropped when the frame is garbage collected."""
+    key = id(prices)
+    entry = _BY_FRAME.get(key)
+    if entry is None or entry[0]() is not prices:
+        ref = weakref.ref(prices, lambda _, key=key: _BY_FRAME.pop(key, None))
+        entry = _BY_FRAME[key] = (ref, {})
+    return entry[1]
+
+
+def returns_panel(prices, dtype=np.float64, version=None, hash=False):
+    """
+    Memoized ReturnsPanel for `prices`.
+
+    version: cheap identity of the data known to the caller; equal versions
+    share one panel across frames. hash=True keys on data_version(prices)
+    instead (a full pass over the values). Otherwise the memo is per frame
+    object, so mutating a frame in place after the first call is not seen.
+    """
+    if version is None and hash:
+        version = data_version(prices)
+    if version is None:
+        panels = _frame_panels(prices)
+        dt = np.dtype(dtype).str
+        if dt not in panels:
+            panels[dt] = ReturnsPanel(prices, dtype=dtype)
+        return panels[dt]
+
+    key = (version, np.dtype(dtype).str)
+    panel = _PANELS.get(key)
+    if panel is None:
+        panel = ReturnsPanel(prices, dtype=dtype, version=version)
+        _PANELS[key] = panel
+        if len(_PANELS) > MAX_CACHED_PANELS:
+            _PANELS.popitem(last=False)
+    else:
+        _PANELS.move_to_end(key)
+    return panel
@@ -0,0 +1,371 @@
+"""
+Local columnar OHLCV store shared by every loader in the lab.
+
+Each (interval, ticker) pair lives in its own directory as two flat binary
+columns:
+    <root>/<interval>/<ticker>/index.i8   int64 nanosecond timestamps
+    <root>/<interval>/<ticker>/ohlcv.f8   float64 rows of Open, High, Low, Close, Volume
+
+Reads memory-map the files, so loading a large universe touches no network
+and only pages in the requested date range. Writes are appends of rows newer
+than the last stored timestamp, and a refresh only downloads the bars after
+each ticker's last stored timestamp. Every tail download re-requests the
+last stored bar: downloads are split/dividend adjusted as of today, so a
+changed Close on that bar means the stored history is stale, and the ticker
+is re-downloaded and rewritten instead of appended to. A request that starts before a ticker's
+stored history re-downloads the whole range and rewrites that ticker's files.
+An optional third file, head.i8, records the earliest start already fetched
+so tickers listed after that date are not downloaded again.
+"""
+import hashlib
+import os
+import warnings
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.offsets import BDay
+
+from market_data.fetcher import FIELDS, Fetcher, normalize_ohlcv
+from market_data.panel import align_panel
+from market_data.yf_csv import read_yf_csv
+
+DEFAULT_ROOT = os.environ.get(
+    "QUANT_LAB_STORE", os.path.join(os.path.expanduser("~"), ".quant_lab", "prices")
+)
+
+
+# -------------------------------------------------------
+# Helpers
+# -------------------------------------------------------
+
+def _timestamp(value):
+    return None if value is None else pd.Timestamp(value).value
+
+
+_ALL_HISTORY = np.iinfo(np.int64).min
+
+# relative Close change on the overlapping bar that triggers a re-download
+ADJUST_RTOL = 1e-6
+
+
+def _last_complete_session(end=None):
+    """Last session expected to be stored for a yfinance-style exclusive `end`."""
+    end = pd.Timestamp.today() if end is None else pd.Timestamp(end)
+    return end.normalize() - BDay(1)
+
+
+# -------------------------------------------------------
+# Store
+# -------------------------------------------------------
+
+class PriceStore:
+    """
+    OHLCV store keyed by ticker and timestamp.
+
+    append() ignores rows older than the last stored timestamp of a ticker;
+    backfilling earlier history goes through write(), which rewrites the
+    ticker's files (refresh() does this when `start` precedes the stored data).
+    """
+
+    def __init__(self, root=None, interval="1d", fetcher=None):
+        self.root = root or DEFAULT_ROOT
+        self.interval = interval
+        self.base = os.path.join(self.root, interval)
+        self.fetcher = fetcher or Fetcher()
+        self.failures = {}      # {ticker: exception} of the last refresh
+
+    def _dir(self, ticker):
+        return os.path.join(self.base, quote(ticker, safe=""))
+
+    def tickers(self):
+        if not os.path.isdir(self.base):
+            return []
+        return sorted(unquote(name) for name in os.listdir(self.base))
+
+    def __contains__(self, ticker):
+        return len(self._arrays(ticker)[0]) > 0
+
+    # ---------------------------
+    #  Raw column access
+    # ---------------------------
+    def _arrays(self, ticker):
+        """Memory-map the (index, values) columns of a ticker."""
+        folder = self._dir(ticker)
+        index_path = os.path.join(folder, "index.i8")
+        values_path = os.path.join(folder, "ohlcv.f8")
+        if not os.path.exists(index_path) or os.path.getsize(index_path) == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(FIELDS)))
+
+        # index is written after values, so its length bounds complete rows
+        n = os.path.getsize(index_path) // 8
+        n = min(n, os.path.getsize(values_path) // (8 * len(FIELDS)))
+        index = np.memmap(index_path, dtype=np.int64, mode="r", shape=(n,))
+        values = np.memmap(values_path, dtype=np.float64, mode="c", shape=(n, len(FIELDS)))
+        return index, values
+
+    def first_date(self, ticker):
+        """First stored timestamp of a ticker, or None if it is not stored."""
+        index, _ = self._arrays(ticker)
+        return pd.Timestamp(index[0]) if len(index) else None
+
+    def _head(self, ticker):
+        path = os.path.join(self._dir(ticker), "head.i8")
+        return int(np.fromfile(path, dtype=np.int64)[0]) if os.path.exists(path) else None
+
+    def _mark_head(self, ticker, start):
+        head = _ALL_HISTORY if start is None else _timestamp(start)
+        np.array([head], dtype=np.int64).tofile(os.path.join(self._dir(ticker), "head.i8"))
+
+    def covered_from(self, ticker):
+        """
+        Earliest timestamp the stored history of a ticker is complete from:
+        the first stored bar, or an earlier start whose download came back
+        starting later (e.g. a listing after that date). None if not stored.
+        """
+        first = self.first_date(ticker)
+        head = self._head(ticker)
+        if first is None or head is None:
+            return first
+        return min(first, pd.Timestamp.min if head == _ALL_HISTORY else pd.Timestamp(head))
+
+    def _covers(self, ticker, start):
+        if start is None:
+            return True
+        covered = self.covered_from(ticker)
+        start = pd.Timestamp(start)
+        if not self.interval.endswith(("m", "h")):
+            # a start on a weekend is covered by the next session
+            start = start.normalize() + BDay(0)
+        return covered is not None and covered <= start
+
+    def last_date(self, ticker):
+        """Last stored timestamp of a ticker, or None if it is not stored."""
+        index, _ = self._arrays(ticker)
+        return pd.Timestamp(index[-1]) if len(index) else None
+
+    # ---------------------------
+    #  Writes
+    # ---------------------------
+    def append(self, ticker, frame):
+        """Append rows newer than the last stored timestamp. Returns rows written."""
+        frame = normalize_ohlcv(frame)
+        if frame.empty:
+            return 0
+
+        last = self.last_date(ticker)
+        if last is not None:
+            frame = frame[frame.index > last]
+            if frame.empty:
+                return 0
+
+        folder = self._dir(ticker)
+        os.makedirs(folder, exist_ok=True)
+        values = np.ascontiguousarray(frame.to_numpy(dtype=np.float64))
+        index = np.ascontiguousarray(frame.index.asi8, dtype=np.int64)
+        with open(os.path.join(folder, "ohlcv.f8"), "ab") as fh:
+            fh.write(values.tobytes())
+        with open(os.path.join(folder, "index.i8"), "ab") as fh:
+            fh.write(index.tobytes())
+        return len(frame)
+
+    def write(self, ticker, frame):
+        """Replace the stored history of a ticker with `frame`. Returns rows written."""
+        frame = normalize_ohlcv(frame)
+        if frame.empty:
+            return 0
+
+        folder = self._dir(ticker)
+        os.makedirs(folder, exist_ok=True)
+        values = np.ascontiguousarray(frame.to_numpy(dtype=np.float64))
+        index = np.ascontiguousarray(frame.index.asi8, dtype=np.int64)
+        head = os.path.join(folder, "head.i8")
+        if os.path.exists(head):
+            os.remove(head)
+        for name, data in (("ohlcv.f8", values), ("index.i8", index)):
+            path = os.path.join(folder, name)
+            with open(path + ".tmp", "wb") as fh:
+                fh.write(data.tobytes())
+            os.replace(path + ".tmp", path)
+        return len(frame)
+
+    def ingest_csv(self, path, ticker=None):
+        """Append a yfinance-style CSV (Price / Ticker / Date header rows)."""
+        arrays = read_yf_csv(path)
+        last = self.last_date(ticker or arrays.ticker)
+        if last is not None and (len(arrays.index) == 0 or arrays.index[-1] <= last.to_datetime64()):
+            return 0
+        return self.append(ticker or arrays.ticker, arrays.to_frame())
+
+    # ---------------------------
+    #  Reads
+    # ---------------------------
+    @staticmethod
+    def _bounds(index, start=None, end=None):
+        lo, hi = 0, len(index)
+        if start is not None:
+            lo = np.searchsorted(index, _timestamp(start), side="left")
+        if end is not None:
+            # end is exclusive, like the yfinance downloads that fill the store
+            hi = np.searchsorted(index, _timestamp(end), side="left")
+        return lo, hi
+
+    def read(self, ticker, start=None, end=None):
+        """OHLCV frame of one ticker restricted to [start, end)."""
+        index, values = self._arrays(ticker)
+        lo, hi = self._bounds(index, start, end)
+        return pd.DataFrame(
+            values[lo:hi],
+            index=pd.DatetimeIndex(index[lo:hi].view("datetime64[ns]"), name="Date"),
+            columns=list(FIELDS),
+        )
+
+    def missing_heads(self, tickers, start=None):
+        """Stored tickers whose history does not reach back to `start`."""
+        return [t for t in tickers if t in self and not self._covers(t, start)]
+
+    def missing_tails(self, tickers, start=None, end=None):
+        """
+        {ticker: start} of the downloads needed to cover [start, end): the
+        full range from `start` for unseen tickers and for stored ones whose
+        history begins after `start` (see missing_heads), and only the bars
+        after the last stored timestamp otherwise.
+        """
+        target = _last_complete_session(end)
+        intraday = self.interval.endswith(("m", "h"))
+        heads = set(self.missing_heads(tickers, start))
+        tails = {}
+        for t in tickers:
+            last = self.last_date(t)
+            if last is None or t in heads:
+                tails[t] = start
+            elif last.normalize() < target:
+                # overlap the last stored bar (intraday: its whole day); append drops it
+                tails[t] = last if not intraday else last.normalize()
+        return tails
+
+    def _history_start(self, ticker):
+        """Start to re-download a ticker's whole stored history from."""
+        return None if self._head(ticker) == _ALL_HISTORY else self.covered_from(ticker)
+
+    def _adjusted_since(self, ticker, frame):
+        """True if the download re-prices the last stored bar (split or dividend since)."""
+        index, values = self._arrays(ticker)
+        last = pd.Timestamp(index[-1])
+        if last not in frame.index:
+            return False
+        stored = values[-1, FIELDS.index("Close")]
+        fresh = frame.at[last, "Close"]
+        return not np.isclose(fresh, stored, rtol=ADJUST_RTOL, atol=0.0)
+
+    def refresh(self, tickers, start=None, end=None):
+        """
+        Download only missing bars, up to the last complete session before
+        `end` (today when end is None). Tails are appended; unseen tickers and
+        head gaps (start before the stored history) are written whole, and so
+        are tickers whose overlapping last bar was re-adjusted, after
+        re-downloading their full stored range. Returns rows written per ticker;
+        tickers whose downloads failed are collected in self.failures.
+        """
+        heads = set(self.missing_heads(tickers, start))
+        tails = self.missing_tails(tickers, start, end)
+        # stop at the last complete session: today's unfinished bar would be
+        # stored and then read as a re-adjustment by the next refresh
+        fetch_end = _last_complete_session(end) + pd.Timedelta(days=1)
+        fetched = self.fetcher.fetch_many(list(tails), tails, fetch_end, self.interval)
+        self.failures = dict(self.fetcher.failures)
+        written, stale = {}, {}
+        for t, df in fetched.items():
+            if t in heads or t not in self:
+                # keep stored bars beyond the downloaded range (an `end` in the past)
+                newer = self.read(t, start=df.index[-1] + pd.Timedelta(1, "ns"))
+                written[t] = self.write(t, pd.concat([df, newer]) if len(newer) else df)
+                self._mark_head(t, start)
+            elif self._adjusted_since(t, df):
+                stale[t] = self._history_start(t)
+            else:
+                written[t] = self.append(t, df)
+
+        if stale:
+            refetched = self.fetcher.fetch_many(list(stale), stale, fetch_end, self.interval)
+            self.failures.update(self.fetcher.failures)
+            for t, df in refetched.items():
+                written[t] = self.write(t, df)
+                self._mark_head(t, stale[t])
+        return written
+
+    def _check_coverage(self, tickers, start):
+        short = {t: self.covered_from(t) for t in tickers if t in self and not self._covers(t, start)}
+        if short:
+            detail = ", ".join(f"{t} from {d:%Y-%m-%d}" for t, d in short.items())
+            warnings.warn(f"stored history starts after {pd.Timestamp(start):%Y-%m-%d}: {detail}",
+                          stacklevel=3)
+
+    def load(self, tickers, start=None, end=None, fetch=True):
+        """
+        Read tickers from the store. With fetch=True, missing history is
+        downloaded first through refresh(): whole ranges for unseen tickers
+        and for stored ones that start after `start`, and only the tail
+        otherwise. Tickers with no data anywhere are left out; a warning
+        lists stored tickers whose history still starts after `start`.
+        """
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        if fetch:
+            self.refresh(tickers, start, end)
+        self._check_coverage(tickers, start)
+
+        data = {}
+        for t in tickers:
+            df = self.read(t, start, end)
+            if not df.empty:
+                data[t] = df
+        return data
+
+    def load_panel(self, tickers, start=None, end=None, field="Close", calendar=None,
+                   fill=None, limit=None, fetch=True):
+        """
+        AlignedPanel of one field, built straight from the memory-mapped
+        columns. See market_data.panel for the calendar and fill options.
+        The panel's version identifies the request and the stored files
+        (size and modification time), for use as a returns_panel key.
+        """
+        if isinstance(tickers, str):
+            tickers = [tickers]
+        if fetch:
+            self.refresh(tickers, start, end)
+        self._check_coverage(tickers, start)
+
+        col = FIELDS.index(field)
+        series = {}
+        for t in tickers:
+            index, values = self._arrays(t)
+            lo, hi = self._bounds(index, start, end)
+            if hi > lo:
+                series[t] = (index[lo:hi], values[lo:hi, col])
+        panel = align_panel(series, calendar=calendar, fill=fill, limit=limit)
+        panel.version = self._version(tickers, start, end, field, calendar, fill, limit)
+        return panel
+
+    def _version(self, tickers, start, end, field, calendar, fill, limit):
+        parts = [self.base, field, str(start), str(end), str(fill), str(limit)]
+        if calendar is not None:
+            cal = np.ascontiguousarray(pd.DatetimeIndex(calendar).as_unit("ns").asi8)
+            parts.append(hashlib.blake2b(cal.tobytes(), digest_size=8).hexdigest())
+        for t in tickers:
+            path = os.path.join(self._dir(t), "ohlcv.f8")
+            st = os.stat(path) if os.path.exists(path) else None
+            parts.append(f"{t}:{st.st_size}:{st.st_mtime_ns}" if st else f"{t}:-")
+        return "|".join(parts)
+
+    def load_close(self, tickers, start=None, end=None, field="Close", fill=None, fetch=True):
+        """Panel frame of one field (default Close) with one column per ticker."""
+        return self.load_panel(tickers, start, end, field=field, fill=fill, fetch=fetch).to_frame()
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m market_data.store portfolio_models/*/datasets/*
+    store = PriceStore()
+    for path in sys.argv[1:]:
+        print(f"{path}: {store.ingest_csv(path)} rows appended")
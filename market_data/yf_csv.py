@@ -0,0 +1,121 @@
+"""
+Fast reader for the yfinance CSV layout used in portfolio_models/*/datasets/:
+
+    Price,Close,High,Low,Open,Volume
+    Ticker,AAPL,AAPL,AAPL,AAPL,AAPL
+    Date,,,,,
+    2022-01-03,178.44,179.29,174.22,174.34,104487900
+
+The body is parsed straight into a contiguous float64 matrix plus a
+datetime64[ns] index. The first read writes .npy sidecars into a
+.npycache/ folder next to the CSV; later reads memory-map them.
+"""
+import json
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = ".npycache"
+
+
+@dataclass(frozen=True)
+class PriceArrays:
+    index: np.ndarray   # datetime64[ns], shape (n,)
+    values: np.ndarray  # float64, shape (n, len(fields))
+    fields: tuple
+    ticker: str
+
+    def to_frame(self):
+        return pd.DataFrame(
+            self.values,
+            index=pd.DatetimeIndex(self.index, name="Date"),
+            columns=list(self.fields),
+        )
+
+
+# -------------------------------------------------------
+# Parsing
+# -------------------------------------------------------
+
+def _parse_dates(dates):
+    try:
+        return np.array(dates, dtype="datetime64[ns]")
+    except ValueError:
+        # timestamps with a UTC offset (intraday downloads)
+        index = pd.to_datetime(list(dates), utc=True).tz_convert(None)
+        return index.as_unit("ns").to_numpy()
+
+
+def parse_yf_csv(path):
+    """Parse a three-header-row yfinance CSV without pandas."""
+    with open(path) as fh:
+        price_row = fh.readline().rstrip("\r\n").split(",")
+        ticker_row = fh.readline().rstrip("\r\n").split(",")
+        date_row = fh.readline()
+        body = fh.read()
+
+    if price_row[0] != "Price" or ticker_row[0] != "Ticker" or not date_row.startswith("Date"):
+        raise ValueError(f"{path} is not in the yfinance Price/Ticker/Date layout")
+
+    fields = tuple(price_row[1:])
+    ticker = ticker_row[1] if len(ticker_row) > 1 else os.path.basename(path)
+    rows = [line.partition(",") for line in body.splitlines() if line]
+    if not rows:
+        return PriceArrays(np.empty(0, "datetime64[ns]"), np.empty((0, len(fields))), fields, ticker)
+
+    cells = ",".join(row[2] for row in rows).split(",")
+    if "" in cells:
+        cells = [c or "nan" for c in cells]
+    values = np.array(cells, dtype=np.float64).reshape(len(rows), len(fields))
+    index = _parse_dates([row[0] for row in rows])
+    return PriceArrays(index, values, fields, ticker)
+
+
+# -------------------------------------------------------
+# Sidecar cache
+# -------------------------------------------------------
+
+def _cache_paths(path):
+    folder = os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR)
+    stem = os.path.join(folder, os.path.basename(path))
+    return folder, stem + ".index.npy", stem + ".values.npy", stem + ".meta.json"
+
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def read_yf_csv(path, cache=True):
+    """
+    Load a yfinance CSV as PriceArrays, memory-mapping the .npy sidecars
+    when they are newer than the CSV and writing them otherwise.
+    """
+    if not cache:
+        return parse_yf_csv(path)
+
+    folder, index_path, values_path, meta_path = _cache_paths(path)
+    stamp = _source_stamp(path)
+    try:
+        with open(meta_path) as fh:
+            meta = json.load(fh)
+        if meta["source"] == stamp:
+            return PriceArrays(
+                np.load(index_path, mmap_mode="r"),
+                np.load(values_path, mmap_mode="r"),
+                tuple(meta["fields"]),
+                meta["ticker"],
+            )
+    except (OSError, ValueError, KeyError):
+        pass
+
+    arrays = parse_yf_csv(path)
+    os.makedirs(folder, exist_ok=True)
+    np.save(index_path, arrays.index)
+    np.save(values_path, arrays.values)
+    # meta is written last: it is what marks the sidecars as complete
+    with open(meta_path, "w") as fh:
+        json.dump({"source": stamp, "fields": list(arrays.fields), "ticker": arrays.ticker}, fh)
+    return arrays
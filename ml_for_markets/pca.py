@@ -1,13 +1,18 @@
+import os
+import sys
 import yfinance as yf
 import pandas as pd
 import matplotlib.pyplot as plt
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.returns import returns_panel
+
 tickers = ["AAPL","MSFT","GOOGL","AMZN"]
 prices = yf.download(tickers, start="2015-01-01", progress=False)["Close"]
 
-returns = prices.pct_change().dropna()
+returns = returns_panel(prices).simple_frame()
 scaled = StandardScaler().fit_transform(returns)
 
 pca = PCA(n_components=2)
@@ -0,0 +1,51 @@
+"""
+Mergeable sample moments.
+
+Moments holds (count, mean, M2) of a sample, per column for 2-D samples.
+Two summaries combine exactly with Chan et al.'s pairwise update, so partial
+results from batches, workers or streaming chunks can be merged without
+keeping the samples. Merging in a fixed order gives bit-identical results
+however the batches were scheduled.
+"""
+import numpy as np
+
+
+class Moments:
+    """Count, mean and sum of squared deviations (M2) of a sample."""
+
+    def __init__(self, n=0, mean=0.0, m2=0.0):
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def of(cls, samples):
+        """Moments of a (n,) or (n, k) array of samples along axis 0."""
+        samples = np.asarray(samples, dtype=np.float64)
+        n = samples.shape[0]
+        if n == 0:
+            return cls()
+        mean = samples.mean(axis=0)
+        dev = samples - mean
+        return cls(n, mean, np.einsum("i...,i...->...", dev, dev))
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            return other
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        mean = self.mean + delta * (other.n / n)
+        m2 = self.m2 + other.m2 + delta * delta * (self.n * other.n / n)
+        return Moments(n, mean, m2)
+
+    @property
+    def variance(self):
+        """Unbiased sample variance."""
+        return self.m2 / (self.n - 1) if self.n > 1 else np.nan * np.asarray(self.m2)
+
+    @property
+    def stderr(self):
+        """Standard error of the mean."""
+        return np.sqrt(self.variance / self.n) if self.n > 1 else np.nan * np.asarray(self.m2)
@@ -0,0 +1,75 @@
+"""
+Parallel Monte Carlo runner.
+
+The path budget is cut into fixed-size batches and batch i always draws from
+child i of np.random.SeedSequence(seed).spawn(...), so each batch has its own
+statistically independent stream no matter which process runs it. Workers
+return only Moments summaries; they are merged in batch order, which makes
+the result bit-reproducible for a given (seed, n_paths, batch_size) with 1
+or 64 workers.
+
+A kernel is any picklable callable kernel(n, rng, *args, **kwargs) returning
+n samples, shaped (n,) or (n, k) (e.g. one discounted payoff per strike).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .moments import Moments
+
+
+def spawn_streams(seed, n):
+    """n independent Generators from one root seed."""
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def _run_batch(task):
+    kernel, n, rng, args, kwargs = task
+    return Moments.of(kernel(n, rng, *args, **kwargs))
+
+
+def run_parallel(kernel, n_paths, seed=None, batch_size=50_000, max_workers=None,
+                 args=(), kwargs=None):
+    """
+    Evaluate `kernel` over n_paths paths on a process pool.
+
+    max_workers defaults to os.cpu_count(); max_workers=1 runs in-process
+    (same numbers, no pool). Returns the merged Moments, whose mean and stderr
+    are the estimate and its standard error.
+    """
+    kwargs = kwargs or {}
+    sizes = [min(batch_size, n_paths - start) for start in range(0, n_paths, batch_size)]
+    # Generators pickle with their state, so each task ships its own stream
+    streams = spawn_streams(seed, len(sizes))
+    tasks = [(kernel, n, rng, args, kwargs) for n, rng in zip(sizes, streams)]
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        partials = map(_run_batch, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            partials = list(pool.map(_run_batch, tasks))
+
+    total = Moments()
+    for part in partials:       # fixed merge order -> bit-reproducible
+        total = total.merge(part)
+    return total
+
+
+def gbm_call_payoffs(n, rng, S0, K, r, sigma, T):
+    """Discounted European call payoffs under GBM; one column per strike."""
+    z = rng.standard_normal(n)
+    ST = S0 * np.exp((r - 0.5 * sigma * sigma) * T + sigma * np.sqrt(T) * z)
+    return np.exp(-r * T) * np.maximum(ST[:, None] - np.atleast_1d(K)[None, :], 0.0)
+
+
+if __name__ == "__main__":
+    import time
+
+    strikes = np.array([90.0, 100.0, 110.0])
+    for workers in (1, 2, 4):
+        t0 = time.perf_counter()
+        res = run_parallel(gbm_call_payoffs, 4_000_000, seed=2024, batch_size=250_000,
+                           max_workers=workers, args=(100.0, strikes, 0.05, 0.2, 1.0))
+        print(f"{workers} worker(s): {res.mean} ± {res.stderr}  [{time.perf_counter() - t0:.2f}s]")
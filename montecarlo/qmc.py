@@ -0,0 +1,60 @@
+"""
+Low-discrepancy normal draws and Brownian-bridge path construction.
+
+standard_normals(n, d, method) returns an (n, d) matrix of N(0, 1) draws from
+the pseudo-random generator or from a scrambled Sobol / Halton sequence
+(mapped through the inverse normal CDF). brownian_bridge reorders d normals
+into d path increments so that the first (best distributed) coordinates fix
+the coarse shape of the path - terminal value first, then midpoints - which
+is what lets QMC beat plain MC on path-dependent payoffs.
+"""
+import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+SAMPLING_METHODS = ("pseudo", "sobol", "halton")
+
+
+def standard_normals(n, d, method="pseudo", rng=None, scramble=True):
+    """(n, d) standard normals; QMC methods draw one randomized point set."""
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"method must be one of {SAMPLING_METHODS}, got {method!r}")
+    rng = rng if rng is not None else np.random.default_rng()
+    if method == "pseudo":
+        return rng.standard_normal((n, d))
+    engine = (qmc.Sobol if method == "sobol" else qmc.Halton)(d, scramble=scramble, seed=rng)
+    u = engine.random(n)
+    # unscrambled sequences start at 0, which would map to -inf
+    return ndtri(np.clip(u, 1e-12, 1.0 - 1e-12))
+
+
+def _bridge_schedule(d):
+    """(index, left, right, w_left, w_right, sd) for each bisection point of 0..d."""
+    schedule = []
+    queue = [(0, d)]
+    while queue:
+        left, right = queue.pop(0)
+        if right - left < 2:
+            continue
+        mid = (left + right) // 2
+        span = right - left
+        schedule.append((mid, left, right, (right - mid) / span, (mid - left) / span,
+                         np.sqrt((mid - left) * (right - mid) / span)))
+        queue += [(left, mid), (mid, right)]
+    return schedule
+
+
+def brownian_bridge(z):
+    """
+    Map (n, d) iid normals to (n, d) standardized Brownian increments.
+
+    Column 0 sets W(d), the following columns fill in midpoints by bisection.
+    The output has the same distribution as iid normals, so any path builder
+    that scales increments by sqrt(dt) can use it unchanged.
+    """
+    n, d = z.shape
+    W = np.zeros((n, d + 1))
+    W[:, d] = np.sqrt(d) * z[:, 0]
+    for col, (mid, left, right, wl, wr, sd) in enumerate(_bridge_schedule(d), start=1):
+        W[:, mid] = wl * W[:, left] + wr * W[:, right] + sd * z[:, col]
+    return np.diff(W, axis=1)
@@ -0,0 +1,69 @@
+"""
+Streaming Monte Carlo estimation with early stopping.
+
+StreamingEstimator folds batches of draws into running Moments (a batched
+Welford update), so memory stays at one batch whatever the sample size. It
+stops as soon as the standard error reaches `target_se`, or falls below
+`rel_tol` times |mean| - for every column when the draws are 2-D - instead
+of running to a fixed n.
+
+    est = StreamingEstimator(target_se=1e-3)
+    res = est.run(batches(sampler, 100_000, rng))
+    res.mean, res.stderr, est.converged
+"""
+import numpy as np
+
+from .moments import Moments
+
+
+def batches(sampler, batch_size, rng=None, max_samples=None):
+    """Yield sampler(batch_size, rng) forever (or until max_samples draws)."""
+    rng = rng if rng is not None else np.random.default_rng()
+    drawn = 0
+    while max_samples is None or drawn < max_samples:
+        n = batch_size if max_samples is None else min(batch_size, max_samples - drawn)
+        yield sampler(n, rng)
+        drawn += n
+
+
+class StreamingEstimator:
+    """Running mean / variance of a stream of batches with a precision target."""
+
+    def __init__(self, target_se=None, rel_tol=None, min_samples=1_000, max_samples=None,
+                 keep_history=False):
+        if target_se is None and rel_tol is None and max_samples is None:
+            raise ValueError("set target_se, rel_tol or max_samples, or the stream never stops")
+        self.target_se = target_se
+        self.rel_tol = rel_tol
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.moments = Moments()
+        self.converged = False
+        self.history = [] if keep_history else None
+
+    def precise_enough(self):
+        m = self.moments
+        if m.n < max(self.min_samples, 2):
+            return False
+        se = np.asarray(m.stderr)
+        ok = np.ones(se.shape, dtype=bool)
+        if self.target_se is not None:
+            ok &= se <= self.target_se
+        if self.rel_tol is not None:
+            ok &= se <= self.rel_tol * np.abs(m.mean)
+        return bool(ok.all())
+
+    def update(self, batch):
+        """Fold one batch in; returns True once the stream should stop."""
+        self.moments = self.moments.merge(Moments.of(batch))
+        if self.history is not None:
+            self.history.append((self.moments.n, self.moments.mean, self.moments.stderr))
+        self.converged = self.precise_enough()
+        capped = self.max_samples is not None and self.moments.n >= self.max_samples
+        return self.converged or capped
+
+    def run(self, stream):
+        for batch in stream:
+            if self.update(batch):
+                break
+        return self.moments
@@ -10,40 +10,102 @@ A clean educational toolkit for simulating probability experiments:
 - Conditional probabilities
 - Bayes theorem engine
 """
-import random
-from collections import Counter
 import itertools
+import time
+from collections import Counter
+
+import numpy as np
+
+COIN_FACES = np.array(["T", "H"])
 
 ## 01. Coin simulator
-def simulate_coins(n_tosses: int = 1, n_trials: int = 10000):
-    """iumulates tossing n_tosses coins per trial"""
-    outcomes = []
-    for _ in range(n_trials):
-        toss = "".join(random.choice(['H','T']) for _ in range(n_tosses))
-        outcomes.append(toss)
-    return Counter(outcomes), n_trials
+def toss_coins(n_tosses: int = 1, n_trials: int = 10000, rng=None):
+    """(n_trials, n_tosses) uint8 array, 1 = heads."""
+    rng = rng if rng is not None else np.random.default_rng()
+    return rng.integers(0, 2, size=(n_trials, n_tosses), dtype=np.uint8)
+
+def simulate_coins(n_tosses: int = 1, n_trials: int = 10000, rng=None):
+    """Simulates tossing n_tosses coins per trial"""
+    codes = encode_outcomes(toss_coins(n_tosses, n_trials, rng), base=2)
+    counts = outcome_counts(codes, 2 ** n_tosses)
+    return Counter({
+        "".join(COIN_FACES[decode_outcome(c, 2, n_tosses)]): int(v) for c, v in counts.items()
+    }), n_trials
 
 ## 02. Dice Simulator
-def simulate_dice(n_dice: int = 2, n_trials: int = 10000):
+def roll_dice(n_dice: int = 2, n_trials: int = 10000, faces: int = 6, rng=None):
+    """(n_trials, n_dice) int8 array of face values 1..faces."""
+    rng = rng if rng is not None else np.random.default_rng()
+    return rng.integers(1, faces + 1, size=(n_trials, n_dice), dtype=np.int8)
+
+def simulate_dice(n_dice: int = 2, n_trials: int = 10000, rng=None):
     """Simulate rolling n dice. """
-    outcomes = []
-    for _ in range(n_trials):
-        roll = tuple(random.randint(1,6) for _ in range(n_dice))
-        outcomes.append(roll)
-    return Counter(outcomes), n_trials
-def probability_sum_k(k: int, n_trials: int = 20000):
-    """Probability that sum of 2 dice equals k."""
-    cnt, total = simulate_dice(2, n_trials)
-    good = sum(v for (a,b), v in cnt.items() if a+b ==k)
-    return good /total
+    codes = encode_outcomes(roll_dice(n_dice, n_trials, rng=rng), base=6, offset=1)
+    counts = outcome_counts(codes, 6 ** n_dice)
+    return Counter({
+        tuple((decode_outcome(c, 6, n_dice) + 1).tolist()): int(v) for c, v in counts.items()
+    }), n_trials
+
+def probability_sum_k(k: int, n_trials: int = 20000, n_dice: int = 2, rng=None):
+    """Probability that sum of n_dice dice (default 2) equals k."""
+    sums = roll_dice(n_dice, n_trials, rng=rng).sum(axis=1, dtype=np.int16)
+    return np.count_nonzero(sums == k) / n_trials
+
+## Outcome encoding: one integer per trial (first column most significant)
+def encode_outcomes(draws, base, offset=0):
+    """Pack each row of draws into an int64 code; codes sort like the tuples."""
+    n = draws.shape[1]
+    if base ** n > np.iinfo(np.int64).max:
+        raise ValueError(f"{base}^{n} outcomes do not fit in an int64 code")
+    weights = base ** np.arange(n - 1, -1, -1, dtype=np.int64)
+    return (draws.astype(np.int64) - offset) @ weights
+
+def decode_outcome(code, base, n):
+    """Digits (0-based) of one packed outcome code."""
+    return np.array([(int(code) // base ** i) % base for i in range(n - 1, -1, -1)])
+
+def outcome_counts(codes, n_outcomes):
+    """{code: count} of observed outcomes: bincount when the space is small, unique otherwise."""
+    if n_outcomes <= 10_000_000:
+        counts = np.bincount(codes, minlength=n_outcomes)
+        seen = np.flatnonzero(counts)
+        return dict(zip(seen.tolist(), counts[seen].tolist()))
+    seen, counts = np.unique(codes, return_counts=True)
+    return dict(zip(seen.tolist(), counts.tolist()))
+
+## Exact distributions by polynomial convolution
+def convolution_power(pmf, n):
+    """pmf of the sum of n iid copies: the n-th power of the generating polynomial (repeated squaring)."""
+    result = np.array([1.0])
+    base = np.asarray(pmf, dtype=np.float64)
+    while n:
+        if n & 1:
+            result = np.convolve(result, base)
+        base = np.convolve(base, base)
+        n >>= 1
+    return result
+
+def dice_sum_distribution(n_dice: int = 2, faces: int = 6):
+    """Exact (sums, probabilities) of the total of n_dice fair dice."""
+    probs = convolution_power(np.full(faces, 1.0 / faces), n_dice)
+    return np.arange(n_dice, n_dice * faces + 1), probs
+
+def heads_distribution(n_tosses: int = 1, p: float = 0.5):
+    """Exact (heads, probabilities) for n_tosses coins with P(H) = p."""
+    return np.arange(n_tosses + 1), convolution_power([1.0 - p, p], n_tosses)
+
 # -----------------------------------------------------------
 # 3. GENERAL EVENT PROBABILITY
 # -----------------------------------------------------------
 def event_probability(outcome_space, event_filter):
     """
-    outcome_space: list/iterable of outcomes
+    outcome_space: list/iterable of outcomes, or a lazy OutcomeSpace
     event_filter: function that returns True if outcome ∈ event
+                  (for an OutcomeSpace: a vectorized predicate on an
+                  (m, n) chunk of outcomes returning m booleans)
     """
+    if isinstance(outcome_space, OutcomeSpace):
+        return outcome_space.probabilities(event_filter)["P(A)"]
     total = len(outcome_space)
     count = sum(1 for x in outcome_space if event_filter(x))
     return count / total
@@ -55,7 +117,10 @@ def event_probability(outcome_space, event_filter):
 def conditional_probability(outcome_space, A_filter, B_filter):
     """
     Computes P(A | B) = P(A ∩ B) / P(B)
+    (streams an OutcomeSpace chunk by chunk with vectorized filters)
     """
+    if isinstance(outcome_space, OutcomeSpace):
+        return outcome_space.probabilities(A_filter, B_filter)["P(A|B)"]
     A_and_B = sum(1 for x in outcome_space if A_filter(x) and B_filter(x))
     B = sum(1 for x in outcome_space if B_filter(x))
 
@@ -64,6 +129,70 @@ def conditional_probability(outcome_space, A_filter, B_filter):
     return A_and_B / B
 
 
+## Lazy outcome spaces
+class OutcomeSpace:
+    """
+    The product space values^n of equally likely outcomes, never materialized.
+
+    Outcomes follow itertools.product order. A chunk fixes the leading
+    digits and spans every combination of the trailing k digits (the largest
+    k with len(values)**k <= chunk_size): that trailing block is built once,
+    so producing a chunk only rewrites its constant prefix columns. chunks()
+    yields (m, n) int8 arrays from one reused buffer, so vectorized
+    predicates run on one chunk at a time and memory stays at chunk_size x n
+    whatever the size of the space.
+    """
+
+    def __init__(self, values, n, chunk_size=1_000_000):
+        self.values = np.asarray(values, dtype=np.int8)
+        self.n = n
+        self.chunk_size = chunk_size
+        self.size = len(self.values) ** n
+
+    def __len__(self):
+        return self.size
+
+    def chunks(self):
+        base = len(self.values)
+        k = 1
+        while k < self.n and base ** (k + 1) <= self.chunk_size:
+            k += 1
+        head = self.n - k
+        # column-major, so row-wise predicates (sums, any) reduce over contiguous columns
+        buf = np.empty((base ** k, self.n), dtype=np.int8, order="F")
+        buf[:, head:] = self.values[np.array(list(itertools.product(range(base), repeat=k)))]
+        for prefix in itertools.product(range(base), repeat=head):
+            buf[:, :head] = self.values[list(prefix)]
+            yield buf
+
+    def probabilities(self, A, B=None):
+        """P(A), and with B also P(B), P(A∩B) and P(A|B), from one streaming pass."""
+        n_a = n_b = n_ab = 0
+        for chunk in self.chunks():
+            a = np.asarray(A(chunk), dtype=bool)
+            n_a += np.count_nonzero(a)
+            if B is not None:
+                b = np.asarray(B(chunk), dtype=bool)
+                n_b += np.count_nonzero(b)
+                n_ab += np.count_nonzero(a & b)
+        out = {"P(A)": n_a / self.size}
+        if B is not None:
+            out.update({
+                "P(B)": n_b / self.size,
+                "P(A∩B)": n_ab / self.size,
+                "P(A|B)": n_ab / n_b if n_b else 0,
+            })
+        return out
+
+def coin_outcomes(n=3, chunk_size=1_000_000):
+    """Lazy space of n coins, 1 = heads, 0 = tails."""
+    return OutcomeSpace([1, 0], n, chunk_size)
+
+def dice_outcomes(n=2, chunk_size=1_000_000):
+    """Lazy space of n dice, faces 1..6."""
+    return OutcomeSpace(range(1, 7), n, chunk_size)
+
+
 # -----------------------------------------------------------
 # 5. BAYES THEOREM ENGINE
 # -----------------------------------------------------------
@@ -101,6 +230,15 @@ if __name__ == "__main__":
     print("\n=== DICE: Probability sum=7 ===")
     print(probability_sum_k(7))
 
+    print("\n=== DICE: exact vs simulated sum of 3 dice (10^7 trials) ===")
+    t0 = time.perf_counter()
+    sums = roll_dice(3, 10_000_000).sum(axis=1, dtype=np.int16)
+    freq = np.bincount(sums, minlength=19)[3:] / sums.size
+    elapsed = time.perf_counter() - t0
+    values, exact = dice_sum_distribution(3)
+    print(f"simulated in {elapsed:.2f}s, max |freq - exact| = {np.abs(freq - exact).max():.2e}")
+    print("P(sum = 10) exact:", exact[values == 10][0], "(27/216 = 0.125)")
+
     print("\n=== Conditional Probability Example ===")
     Ω = coin_space(3)
     # A = first coin is H
@@ -112,6 +250,22 @@ if __name__ == "__main__":
     )
     print("P(first coin = H  | at least 2 H) =", PA_given_B)
 
+    print("\n=== Lazy outcome spaces ===")
+    print("same, vectorized:", conditional_probability(
+        coin_outcomes(3),
+        A_filter=lambda x: x[:, 0] == 1,
+        B_filter=lambda x: x.sum(axis=1) >= 2,
+    ))
+    t0 = time.perf_counter()
+    big = dice_outcomes(11)
+    res = big.probabilities(
+        A=lambda x: x.sum(axis=1, dtype=np.int16) >= 45,
+        B=lambda x: (x == 6).any(axis=1),
+    )
+    print(f"11 dice ({len(big):,} outcomes) in {time.perf_counter() - t0:.1f}s:", res)
+    values, exact = dice_sum_distribution(11)
+    print("P(sum >= 45) by convolution:", exact[values >= 45].sum())
+
     print("\n=== Bayes Theorem Example ===")
     print("P(A|B) =", bayes(prior_A=0.3,
                            likelihood_B_given_A=0.8,
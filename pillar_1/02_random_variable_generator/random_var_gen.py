@@ -14,46 +14,132 @@ Includes:
 - Normal
 """
 
+import time
+
 import numpy as np
 from collections import Counter
 import math
 import matplotlib.pyplot as plt
 
 
+# -------------------------------------------------------
+# GENERATORS & STREAMS
+# -------------------------------------------------------
+
+BIT_GENERATORS = {
+    "pcg64dxsm": np.random.PCG64DXSM,
+    "philox": np.random.Philox,
+    "pcg64": np.random.PCG64,
+}
+
+
+def make_rng(seed=None, bit_generator="pcg64dxsm"):
+    """Generator on the chosen bit generator (PCG64DXSM by default, or Philox)."""
+    if bit_generator not in BIT_GENERATORS:
+        raise ValueError(f"bit_generator must be one of {tuple(BIT_GENERATORS)}, got {bit_generator!r}")
+    return np.random.Generator(BIT_GENERATORS[bit_generator](seed))
+
+
+def substreams(n_streams, seed=None, bit_generator="pcg64dxsm"):
+    """
+    n independent Generators from one seed: stream i is the bit generator
+    jumped i + 1 times, giving non-overlapping jumped streams.
+    """
+    base = make_rng(seed, bit_generator).bit_generator
+    return [np.random.Generator(base.jumped(i + 1)) for i in range(n_streams)]
+
+
+def _rng(rng):
+    return rng if rng is not None else make_rng()
+
+
+def _into(out, values, dtype):
+    if out is None:
+        return values.astype(dtype, copy=False)
+    out[...] = values
+    return out
+
+
 # -------------------------------------------------------
 # DISCRETE RANDOM VARIABLES
+# (numpy has no out= for these draws: a temporary is drawn and copied into `out`)
 # -------------------------------------------------------
 
-def bernoulli(p: float, n: int = 10000):
+def bernoulli(p: float, n: int = 10000, rng=None, out=None, dtype=np.int64):
     """Generate Bernoulli(p)."""
-    samples = np.random.rand(n) < p
-    return samples.astype(int)
+    return _into(out, _rng(rng).random(n) < p, dtype)
 
 
-def binomial(n_trials: int, p: float, n: int = 10000):
+def binomial(n_trials: int, p: float, n: int = 10000, rng=None, out=None, dtype=np.int64):
     """Generate Binomial(n_trials, p)."""
-    return np.random.binomial(n_trials, p, n)
+    return _into(out, _rng(rng).binomial(n_trials, p, n), dtype)
 
 
-def poisson(lmbda: float, n: int = 10000):
+def poisson(lmbda: float, n: int = 10000, rng=None, out=None, dtype=np.int64):
     """Generate Poisson(lambda)."""
-    return np.random.poisson(lmbda, n)
+    return _into(out, _rng(rng).poisson(lmbda, n), dtype)
 
 
 # -------------------------------------------------------
 # CONTINUOUS RANDOM VARIABLES
+# (drawn straight into `out` / a `dtype` buffer: float32 halves memory)
 # -------------------------------------------------------
 
-def uniform(a: float, b: float, n: int = 10000):
-    return np.random.uniform(a, b, n)
-
-
-def exponential(lmbda: float, n: int = 10000):
-    return np.random.exponential(1 / lmbda, n)
-
-
-def normal(mu: float, sigma: float, n: int = 10000):
-    return np.random.normal(mu, sigma, n)
+def uniform(a: float, b: float, n: int = 10000, rng=None, out=None, dtype=np.float64):
+    out = out if out is not None else np.empty(n, dtype=dtype)
+    _rng(rng).random(out=out, dtype=out.dtype)
+    out *= b - a
+    out += a
+    return out
+
+
+def exponential(lmbda: float, n: int = 10000, rng=None, out=None, dtype=np.float64):
+    out = out if out is not None else np.empty(n, dtype=dtype)
+    _rng(rng).standard_exponential(out=out, dtype=out.dtype)
+    out /= lmbda
+    return out
+
+
+def normal(mu: float, sigma: float, n: int = 10000, rng=None, out=None, dtype=np.float64):
+    out = out if out is not None else np.empty(n, dtype=dtype)
+    _rng(rng).standard_normal(out=out, dtype=out.dtype)
+    out *= sigma
+    out += mu
+    return out
+
+
+SAMPLERS = {
+    "bernoulli": bernoulli,
+    "binomial": binomial,
+    "poisson": poisson,
+    "uniform": uniform,
+    "exponential": exponential,
+    "normal": normal,
+}
+FLOAT_SAMPLERS = ("uniform", "exponential", "normal")
+
+
+def sample_many(spec, n: int = 10000, rng=None, dtype=np.float64, out=None, int_dtype=np.int64):
+    """
+    Fill a dict of samples in one call.
+
+    spec: {label: (sampler name, kwargs)}, e.g. {"N(0,1)": ("normal", {"mu": 0, "sigma": 1})}.
+    All draws come from one Generator; continuous samplers use dtype and
+    discrete ones int_dtype.
+    out: optional {label: buffer} of preallocated arrays to fill in place.
+    Continuous samplers draw straight into their buffer, so repeated calls
+    (e.g. inside an MC loop) allocate nothing for them; discrete samplers
+    still draw a temporary that is copied into theirs.
+    """
+    rng = _rng(rng)
+    out = out or {}
+    samples = {}
+    for label, (name, kwargs) in spec.items():
+        if name not in SAMPLERS:
+            raise ValueError(f"unknown sampler {name!r}; choose from {tuple(SAMPLERS)}")
+        kind = dtype if name in FLOAT_SAMPLERS else int_dtype
+        samples[label] = SAMPLERS[name](**kwargs, n=n, rng=rng, out=out.get(label), dtype=kind)
+    return samples
 
 
 # -------------------------------------------------------
@@ -115,4 +201,21 @@ if __name__ == "__main__":
     print("\n=== Normal(μ=0, σ=1) ===")
     nm = normal(0, 1)
     print("Empirical mean:", np.mean(nm))
-    plot_continuous(nm, "Normal(0,1)")
\ No newline at end of file
+    plot_continuous(nm, "Normal(0,1)")
+
+    print("\n=== Bulk sampling into reused float32 buffers ===")
+    spec = {
+        "U(0,1)": ("uniform", {"a": 0, "b": 1}),
+        "Exp(1.5)": ("exponential", {"lmbda": 1.5}),
+        "N(0,1)": ("normal", {"mu": 0, "sigma": 1}),
+    }
+    n = 10_000_000
+    buffers = {label: np.empty(n, dtype=np.float32) for label in spec}
+    for name in ("pcg64dxsm", "philox"):
+        rng = make_rng(42, name)
+        t0 = time.perf_counter()
+        draws = sample_many(spec, n, rng=rng, dtype=np.float32, out=buffers)
+        means = {k: round(float(v.mean()), 4) for k, v in draws.items()}
+        print(f"{name}: {len(spec)} x {n:,} draws in {time.perf_counter() - t0:.2f}s {means}")
+    streams = substreams(4, seed=42)
+    print("independent substream means:", [round(float(normal(0, 1, 100_000, rng=g).mean()), 4) for g in streams])
\ No newline at end of file
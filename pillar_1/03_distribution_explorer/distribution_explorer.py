@@ -9,11 +9,17 @@ Plots:
 For discrete and continuous distributions.
 """
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from collections import Counter
 from scipy.stats import norm
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "02_random_variable_generator")))
+from random_var_gen import make_rng, sample_many
+
 
 # -------------------------------------------------------
 # Helper plotting functions
@@ -74,20 +80,25 @@ def plot_continuous_distribution(samples, title, bins=60):
 # GENERATORS
 # -------------------------------------------------------
 
-def generate_discrete():
-    return {
-        "Bernoulli (p=0.3)": np.random.binomial(1, 0.3, 5000),
-        "Binomial (n=10, p=0.5)": np.random.binomial(10, 0.5, 5000),
-        "Poisson (lambda=3)": np.random.poisson(3, 5000),
-    }
+DISCRETE = {
+    "Bernoulli (p=0.3)": ("bernoulli", {"p": 0.3}),
+    "Binomial (n=10, p=0.5)": ("binomial", {"n_trials": 10, "p": 0.5}),
+    "Poisson (lambda=3)": ("poisson", {"lmbda": 3}),
+}
+
+CONTINUOUS = {
+    "Uniform(0,1)": ("uniform", {"a": 0, "b": 1}),
+    "Exponential(lambda=1.5)": ("exponential", {"lmbda": 1.5}),
+    "Normal(0,1)": ("normal", {"mu": 0, "sigma": 1}),
+}
 
 
-def generate_continuous():
-    return {
-        "Uniform(0,1)": np.random.uniform(0, 1, 5000),
-        "Exponential(lambda=1.5)": np.random.exponential(1 / 1.5, 5000),
-        "Normal(0,1)": np.random.normal(0, 1, 5000),
-    }
+def generate_discrete(n=5000, rng=None):
+    return sample_many(DISCRETE, n, rng=rng)
+
+
+def generate_continuous(n=5000, rng=None, dtype=np.float64):
+    return sample_many(CONTINUOUS, n, rng=rng, dtype=dtype)
 
 
 # -------------------------------------------------------
@@ -97,14 +108,16 @@ def generate_continuous():
 if __name__ == "__main__":
     print("=== DISTRIBUTION EXPLORER ===\n")
 
+    rng = make_rng(42)
+
     # Discrete
-    discrete = generate_discrete()
+    discrete = generate_discrete(rng=rng)
     for name, samples in discrete.items():
         print(f"Plotting {name} ...")
         plot_discrete_distribution(samples, name)
 
     # Continuous
-    continuous = generate_continuous()
+    continuous = generate_continuous(rng=rng)
     for name, samples in continuous.items():
         print(f"Plotting {name} ...")
         plot_continuous_distribution(samples, name)
\ No newline at end of file
@@ -19,16 +19,21 @@ from scipy.stats import norm
 def ensure_reports():
     os.makedirs("reports", exist_ok=True)
 
-def sample_means_from_distribution(draw_fn, n, trials, *args, **kwargs):
+def sample_means_from_distribution(draw_fn, n, trials, *args, chunk_size=1_000_000, **kwargs):
     """
     draw_fn: function to produce samples, e.g., np.random.normal
     n: sample size per mean
     trials: number of independent sample-means to compute
+    chunk_size: max draws held in memory at once (trials are drawn in chunks)
     returns: array of length `trials` with sample means
     """
-    # Efficient vectorized draw: shape (trials, n)
-    draws = draw_fn(size=(trials, n), *args, **kwargs)
-    return draws.mean(axis=1)
+    means = np.empty(trials)
+    rows = max(1, chunk_size // n)
+    # Vectorized draw per chunk: shape (rows, n)
+    for start in range(0, trials, rows):
+        stop = min(start + rows, trials)
+        means[start:stop] = draw_fn(size=(stop - start, n), *args, **kwargs).mean(axis=1)
+    return means
 
 def plot_hist_with_gaussian(sample_means, true_mean, true_sigma, n, dist_name, save=True):
     """
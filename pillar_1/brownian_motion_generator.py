@@ -1,16 +1,84 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def brownian_motion(T=1, N=1000):
-    dt = T/N
-    increments = np.sqrt(dt) * np.random.randn(N)
-    W = np.cumsum(increments)
 
-    plt.plot(np.linspace(0, T, N), W)
-    plt.title("Brownian Motion Sample Path")
+def time_grid(T, n_steps):
+    """Times t_1 .. t_N of the path columns (t_0 = 0 is not stored)."""
+    return T / n_steps * np.arange(1, n_steps + 1)
+
+
+def _cholesky(corr):
+    return None if corr is None else np.linalg.cholesky(np.asarray(corr, dtype=np.float64))
+
+
+def _brownian_fill(out, dt, chol=None, rng=None, W0=None):
+    """Fill out (n_paths, n_steps[, n_assets]) in place with Brownian values."""
+    if chol is None:
+        rng.standard_normal(out=out, dtype=out.dtype)
+    else:
+        z = rng.standard_normal(out.shape, dtype=out.dtype)
+        np.matmul(z, chol.T.astype(out.dtype), out=out)
+    out *= np.sqrt(dt)
+    np.cumsum(out, axis=1, out=out)
+    if W0 is not None:
+        out += W0[:, None]
+    return out
+
+
+def brownian_paths(n_paths=1, n_steps=1000, T=1, corr=None, rng=None, dtype=np.float64, out=None):
+    """
+    Batched Brownian paths W(t_1) .. W(t_N), shape (n_paths, n_steps).
+
+    corr: optional (k, k) correlation matrix -> shape (n_paths, n_steps, k),
+    correlated through one Cholesky factor. out: a preallocated buffer of the
+    right shape and dtype is filled in place and returned (no allocation for
+    the single-asset case). dtype=np.float32 halves memory.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    chol = _cholesky(corr)
+    shape = (n_paths, n_steps) if chol is None else (n_paths, n_steps, chol.shape[0])
+    if out is None:
+        out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    return _brownian_fill(out, T / n_steps, chol, rng)
+
+
+def brownian_chunks(n_paths=1, n_steps=1000, chunk_steps=100, T=1, corr=None, rng=None,
+                    dtype=np.float64):
+    """
+    Generate brownian_paths-style paths in time chunks of chunk_steps steps.
+
+    Yields (t, W) with W of shape (n_paths, <= chunk_steps[, k]), each chunk
+    continuing from the last values of the previous one. A single buffer is
+    reused, so copy a chunk if you need to keep it past the next iteration.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    chol = _cholesky(corr)
+    dt = T / n_steps
+    tail = () if chol is None else (chol.shape[0],)
+    buf = np.empty(n_paths * chunk_steps * int(np.prod(tail)), dtype=dtype)
+    last = np.zeros((n_paths,) + tail, dtype=dtype)
+    for start in range(0, n_steps, chunk_steps):
+        m = min(chunk_steps, n_steps - start)
+        shape = (n_paths, m) + tail
+        W = _brownian_fill(buf[:np.prod(shape)].reshape(shape), dt, chol, rng, last)
+        last = W[:, -1].copy()
+        yield dt * np.arange(start + 1, start + m + 1), W
+
+
+def plot_paths(t, paths, title="Brownian Motion Sample Path", max_paths=20):
+    """Plot up to max_paths rows of a (n_paths, n_steps) array (or one 1-D path)."""
+    paths = np.atleast_2d(paths)
+    plt.plot(t, paths[:max_paths].T)
+    plt.title(title)
     plt.show()
 
+
+def brownian_motion(T=1, N=1000):
+    W = brownian_paths(1, N, T)[0]
+    plot_paths(time_grid(T, N), W)
     return W
 
 if __name__ == "__main__":
-    brownian_motion()
\ No newline at end of file
+    brownian_motion()
@@ -1,17 +1,49 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
-def GBM(S0=100, mu=0.05, sigma=0.2, T=1, N=1000):
-    dt = T/N
-    W = np.cumsum(np.sqrt(dt) * np.random.randn(N))
-    t = np.linspace(0, T, N)
-    S = S0 * np.exp((mu - 0.5 * sigma**2)*t + sigma * W)
+from brownian_motion_generator import brownian_chunks, brownian_paths, plot_paths, time_grid
+
+
+def _to_gbm(W, t, S0, mu, sigma):
+    """Turn Brownian values W (in place) into GBM prices at times t."""
+    W *= sigma
+    W += ((mu - 0.5 * sigma ** 2) * t[:, None]).reshape(t.shape + np.shape(mu)).astype(W.dtype)
+    np.exp(W, out=W)
+    W *= S0
+    return W
+
+
+def gbm_paths(S0=100, mu=0.05, sigma=0.2, T=1, n_steps=1000, n_paths=1, rng=None,
+              dtype=np.float64, out=None):
+    """GBM prices S(t_1) .. S(t_N), shape (n_paths, n_steps); out= fills a buffer in place."""
+    W = brownian_paths(n_paths, n_steps, T, rng=rng, dtype=dtype, out=out)
+    return _to_gbm(W, time_grid(T, n_steps), S0, mu, sigma)
+
 
-    plt.plot(t, S)
-    plt.title("Geometric Brownian Motion")
-    plt.show()
+def correlated_gbm_paths(S0, mu, sigma, corr, T=1, n_steps=252, n_paths=1000, rng=None,
+                         dtype=np.float64, out=None):
+    """
+    Multi-asset GBM with correlated drivers, shape (n_paths, n_steps, n_assets).
 
+    S0, mu and sigma are per-asset vectors; corr is factored once.
+    """
+    S0, mu, sigma = (np.asarray(x, dtype=np.float64) for x in (S0, mu, sigma))
+    W = brownian_paths(n_paths, n_steps, T, corr=corr, rng=rng, dtype=dtype, out=out)
+    return _to_gbm(W, time_grid(T, n_steps), S0, mu, sigma)
+
+
+def gbm_chunks(S0=100, mu=0.05, sigma=0.2, T=1, n_steps=1000, n_paths=1, chunk_steps=100,
+               corr=None, rng=None, dtype=np.float64):
+    """Yield (t, S) time chunks of (optionally correlated) GBM paths; buffer is reused."""
+    if corr is not None:
+        S0, mu, sigma = (np.asarray(x, dtype=np.float64) for x in (S0, mu, sigma))
+    for t, W in brownian_chunks(n_paths, n_steps, chunk_steps, T, corr, rng, dtype):
+        yield t, _to_gbm(W, t, S0, mu, sigma)
+
+
+def GBM(S0=100, mu=0.05, sigma=0.2, T=1, N=1000):
+    S = gbm_paths(S0, mu, sigma, T, N)[0]
+    plot_paths(time_grid(T, N), S, title="Geometric Brownian Motion")
     return S
 
 if __name__ == "__main__":
-    GBM()
\ No newline at end of file
+    GBM()
@@ -1,13 +1,93 @@
+import time
+
 import numpy as np
 
 
-def markov_chain(P, state0, steps=20):
-    state = state0
-    history = [state]
+def state_dtype(n_states):
+    """Smallest signed integer type that holds every state label."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_states <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def simulate_chains(P, state0, steps=20, n_chains=None, rng=None):
+    """
+    Advance many independent chains together, shape (n_chains, steps + 1).
+
+    The cumulative transition rows are precomputed and offset by their row
+    index (row i spans (i, i + 1]), so one searchsorted of current_state + u
+    over that flat array draws the next state of every chain at once.
+    state0 is one start state or an array of per-chain start states; the
+    result uses int8 / int16 labels when the state count allows.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    n = P.shape[0]
+    rng = rng if rng is not None else np.random.default_rng()
+    start = np.atleast_1d(np.asarray(state0))
+    if n_chains is None:
+        n_chains = start.size
+    start = np.broadcast_to(start, (n_chains,))
+
+    cum = np.cumsum(P, axis=1)
+    cum[:, -1] = 1.0                                # no leakage from rounding
+    offset_cum = (cum + np.arange(n)[:, None]).ravel()
+    row_start = np.arange(n) * n
+
+    states = np.empty((n_chains, steps + 1), dtype=state_dtype(n))
+    states[:, 0] = start
+    current = start.astype(np.int64)
+    for t in range(1, steps + 1):
+        u = rng.random(n_chains)
+        current = np.searchsorted(offset_cum, current + u, side="right") - row_start[current]
+        states[:, t] = current
+    return states
+
+
+def stationary_distribution(P):
+    """Solve pi P = pi, sum(pi) = 1 (least squares on the stacked system)."""
+    P = np.asarray(P, dtype=np.float64)
+    n = P.shape[0]
+    A = np.vstack([P.T - np.eye(n), np.ones(n)])
+    b = np.zeros(n + 1)
+    b[-1] = 1.0
+    return np.linalg.lstsq(A, b, rcond=None)[0]
+
 
-    for _ in range(steps):
-        state = np.random.choice(len(P), p=P[state])
-        history.append(state)
+def n_step_matrix(P, n):
+    """P^n by repeated squaring: O(log n) matrix products."""
+    result = np.eye(len(P))
+    base = np.asarray(P, dtype=np.float64)
+    while n:
+        if n & 1:
+            result = result @ base
+        base = base @ base
+        n >>= 1
+    return result
+
+
+def expected_hitting_times(P, targets):
+    """Expected steps to first reach any of `targets` from every state (0 on targets)."""
+    P = np.asarray(P, dtype=np.float64)
+    n = P.shape[0]
+    hit = np.zeros(n, dtype=bool)
+    hit[np.atleast_1d(targets)] = True
+    others = np.flatnonzero(~hit)
+    Q = P[np.ix_(others, others)]
+    h = np.zeros(n)
+    h[others] = np.linalg.solve(np.eye(others.size) - Q, np.ones(others.size))
+    return h
+
+
+def first_passage(states, targets):
+    """First step at which each simulated chain sits in `targets` (-1 if never)."""
+    inside = np.isin(states, np.atleast_1d(targets))
+    first = inside.argmax(axis=1)
+    return np.where(inside.any(axis=1), first, -1)
+
+
+def markov_chain(P, state0, steps=20):
+    history = simulate_chains(P, state0, steps)[0].tolist()
 
     print("State Path:", history)
     return history
@@ -18,4 +98,23 @@ if __name__ == "__main__":
         [0.7, 0.3],
         [0.4, 0.6]
     ])
-    markov_chain(P, 0)
\ No newline at end of file
+    markov_chain(P, 0)
+
+    # calm / normal / stressed regimes, 10^5 one-year scenarios
+    R = np.array([
+        [0.95, 0.04, 0.01],
+        [0.05, 0.90, 0.05],
+        [0.02, 0.08, 0.90],
+    ])
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    paths = simulate_chains(R, 0, steps=252, n_chains=100_000, rng=rng)
+    print(f"{paths.shape[0]:,} chains x {paths.shape[1] - 1} steps ({paths.dtype}) "
+          f"in {time.perf_counter() - t0:.2f}s")
+    print("empirical  day-252:", np.bincount(paths[:, -1], minlength=3) / paths.shape[0])
+    print("P^252 row 0:       ", n_step_matrix(R, 252)[0])
+    print("stationary:        ", stationary_distribution(R))
+    hits = first_passage(paths, 2)
+    print(f"steps to stressed from calm: simulated {hits[hits >= 0].mean():.2f} "
+          f"(censored at 252: {np.mean(hits < 0):.1%}), "
+          f"expected {expected_hitting_times(R, 2)[0]:.2f}")
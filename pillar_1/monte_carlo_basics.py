@@ -1,6 +1,12 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from montecarlo.streaming import StreamingEstimator, batches
+
 def monte_carlo_pi(n=100000):
     x = np.random.rand(n)
     y = np.random.rand(n)
@@ -14,5 +20,18 @@ def monte_carlo_pi(n=100000):
 
     return pi_est
 
+def _quarter_circle_hits(n, rng):
+    x = rng.random(n)
+    y = rng.random(n)
+    return 4.0 * ((x * x + y * y) <= 1)
+
+def estimate_pi(target_se=1e-4, batch_size=1_000_000, max_samples=10**9, rng=None):
+    """Streaming estimate: draws batches until the standard error reaches target_se."""
+    est = StreamingEstimator(target_se=target_se, max_samples=max_samples)
+    res = est.run(batches(_quarter_circle_hits, batch_size, rng))
+    return res.mean, res.stderr, res.n
+
 if __name__ == "__main__":
-    print(monte_carlo_pi())
\ No newline at end of file
+    print(monte_carlo_pi())
+    pi_est, se, n = estimate_pi(target_se=2e-4)
+    print(f"Streaming estimate: {pi_est:.5f} ± {se:.5f} after {n:,} draws")
@@ -6,23 +6,26 @@ Usage: python arima_auto.py
 Outputs: reports/arima_summary.csv, reports/arima_forecast.png
 """
 import os
+import sys
 import warnings
 warnings.filterwarnings("ignore")
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import yfinance as yf
 from statsmodels.tsa.stattools import adfuller
 from pmdarima import auto_arima
 from statsmodels.tsa.arima.model import ARIMA
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.store import PriceStore
+
 REPORTS = "reports"
 os.makedirs(REPORTS, exist_ok=True)
 
 def fetch_close(ticker="^GSPC", start="2018-01-01", end=None):
-    df = yf.download(ticker, start=start, end=end, progress=False)
-    return df["Close"].dropna()
+    df = PriceStore().load_close([ticker], start=start, end=end)
+    return df[ticker].dropna()
 
 def test_stationarity(series):
     res = adfuller(series, maxlag=10, autolag="AIC")
@@ -5,21 +5,22 @@ Simple GARCH(1,1) estimation & volatility forecast using 'arch' package.
 Usage: python garch_model.py
 Outputs: reports/garch_params.csv, reports/garch_vol_forecast.png
 """
-import os, warnings
+import os, sys, warnings
 warnings.filterwarnings("ignore")
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import yfinance as yf
 from arch import arch_model
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.store import PriceStore
+
 REPORTS = "reports"
 os.makedirs(REPORTS, exist_ok=True)
 
 def fetch_returns(ticker="AAPL", start="2018-01-01"):
-    df = yf.download(ticker, start=start, progress=False)
-    close = df["Close"].dropna()
+    close = PriceStore().load_close([ticker], start=start)[ticker].dropna()
     returns = 100 * close.pct_change().dropna()  # percent returns
     return returns
 
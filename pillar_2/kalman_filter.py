@@ -5,20 +5,23 @@ Simple Kalman filter to track time-varying beta between asset returns and market
 Usage: python kalman_filter.py
 Outputs: reports/kalman_beta.png
 """
-import os, warnings
+import os, sys, warnings
 warnings.filterwarnings("ignore")
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import yfinance as yf
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
 
 REPORTS = "reports"
 os.makedirs(REPORTS, exist_ok=True)
 
 def fetch_returns(tickers=["AAPL","^GSPC"], start="2018-01-01"):
-    df = yf.download(tickers, start=start, progress=False)["Close"].dropna()
-    returns = df.pct_change().dropna()
+    df = PriceStore().load_close(tickers, start=start).dropna()
+    returns = returns_panel(df).simple_frame()
     return returns
 
 def run_kalman(Y, X, R=1e-5, Q=1e-5):
@@ -5,22 +5,24 @@ Find cointegrated pairs using Engle-Granger and backtest a simple z-score mean-r
 Usage: python pairs_trading.py
 Outputs: reports/pairs_list.csv, reports/pairs_backtest.png
 """
-import os, warnings
+import os, sys, warnings
 warnings.filterwarnings("ignore")
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import yfinance as yf
 from statsmodels.tsa.stattools import coint
 from statsmodels.regression.linear_model import OLS
 from statsmodels.tools.tools import add_constant
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.store import PriceStore
+
 REPORTS = "reports"
 os.makedirs(REPORTS, exist_ok=True)
 
 def fetch_universe(tickers, start="2019-01-01"):
-    df = yf.download(tickers, start=start, progress=False)["Close"].dropna()
+    df = PriceStore().load_close(tickers, start=start).dropna()
     return df
 
 def find_cointegrated_pairs(data, pvalue_threshold=0.05):
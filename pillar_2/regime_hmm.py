@@ -5,21 +5,24 @@ Hidden Markov Model regime detection (Gaussian emissions) using hmmlearn.
 Usage: python regime_hmm.py
 Outputs: reports/regime_states.csv and reports/regime_plot.png
 """
-import os, warnings
+import os, sys, warnings
 warnings.filterwarnings("ignore")
 
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-import yfinance as yf
 from hmmlearn.hmm import GaussianHMM
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
+
 REPORTS = "reports"
 os.makedirs(REPORTS, exist_ok=True)
 
 def fetch_returns(tickers, start="2019-01-01"):
-    df = yf.download(tickers, start=start, progress=False)["Close"].dropna()
-    returns = df.pct_change().dropna()
+    df = PriceStore().load_close(tickers, start=start).dropna()
+    returns = returns_panel(df).simple_frame()
     return returns
 
 def fit_hmm(returns, n_states=2):
@@ -52,7 +55,7 @@ def main():
     df.to_csv(f"{REPORTS}/regime_states.csv", index=False)
     print("Saved regime states.")
     # plot with index price
-    price = yf.download("^GSPC", start=dates[0], progress=False)["Close"].dropna()
+    price = PriceStore().load_close(["^GSPC"], start=dates[0])["^GSPC"].dropna()
     plot_states(price.index, price.values, states)
     print("Done.")
 
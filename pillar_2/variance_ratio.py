@@ -5,19 +5,21 @@ Implements a simple Lo-MacKinlay variance ratio test for random walk vs mean-rev
 Usage: python variance_ratio.py
 Outputs: reports/vr_results.csv
 """
-import os, warnings
+import os, sys, warnings
 warnings.filterwarnings("ignore")
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 from scipy.stats import norm
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from market_data.store import PriceStore
+
 REPORTS = "reports"
 os.makedirs(REPORTS, exist_ok=True)
 
 def fetch_returns(ticker="AAPL", start="2015-01-01"):
-    df = yf.download(ticker, start=start, progress=False)["Close"].dropna()
+    df = PriceStore().load_close([ticker], start=start)[ticker].dropna()
     r = df.pct_change().dropna()
     return r
 
@@ -1,25 +1,124 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def binomial_call(S, K, r, T, sigma, N):
-    dt = T/N
-    u = np.exp(sigma*np.sqrt(dt))
-    d = 1/u
-    p = (np.exp(r*dt)-d)/(u-d)
+from black_scholes import bs_chain
+
+
+def _exercise_grid(exercise, exercise_times, T, N):
+    """Boolean (N+1, m) grid of the steps at which each contract may be exercised."""
+    m = T.shape[0]
+    if exercise == "european":
+        return None
+    if exercise == "american":
+        return np.ones((N + 1, m), dtype=bool)
+    if exercise == "bermudan":
+        times = np.atleast_1d(np.asarray(exercise_times, dtype=np.float64))
+        steps = np.rint(times[:, None] / T[None, :] * N).astype(np.int64)
+        grid = np.zeros((N + 1, m), dtype=bool)
+        ok = (steps >= 0) & (steps <= N)
+        grid[steps[ok], np.nonzero(ok)[1]] = True
+        return grid
+    raise ValueError(f"exercise must be european, american or bermudan, got {exercise!r}")
+
+
+def crr_lattice(S, K, T, r, sigma, N=200, q=0.0, is_call=True, exercise="european",
+                exercise_times=None, smoothing=False, richardson=False):
+    """
+    Cox-Ross-Rubinstein lattice for a batch of contracts in one sweep.
+
+    S, K, T, r, sigma, q and is_call broadcast together; every contract gets
+    its own N-step tree, and all trees are rolled back simultaneously with
+    in-place backward induction over one (N+1, m) value buffer (plus one
+    scratch and one spot buffer), so memory is O(N) per contract.
+
+    exercise: "european", "american" or "bermudan" (exercise_times in years).
+    smoothing: BBS - replace the last step by Black-Scholes values.
+    richardson: two-point extrapolation 2*V(N) - V(N/2); with smoothing this
+    is the BBSR scheme, which reaches a given accuracy with far fewer steps.
+    N must be even: the odd/even oscillation of the lattice error breaks the
+    extrapolation otherwise.
+    """
+    if richardson:
+        if N % 2:
+            raise ValueError(f"richardson=True needs an even number of steps, got N={N}")
+        kw = dict(q=q, is_call=is_call, exercise=exercise,
+                  exercise_times=exercise_times, smoothing=smoothing)
+        return 2.0 * crr_lattice(S, K, T, r, sigma, N, **kw) - crr_lattice(S, K, T, r, sigma, N // 2, **kw)
+
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma, q)),
+                                 np.asarray(is_call, dtype=bool))
+    shape = arrays[0].shape
+    # nodes along axis 0, contracts along axis 1: each step touches a contiguous block
+    S, K, T, r, sigma, q, is_call = (a.reshape(1, -1) for a in arrays)
+    m = S.shape[1]
 
-    prices = np.array([S*(u**j)*(d**(N-j)) for j in range(N+1)])
-    values = np.maximum(prices-K,0)
+    dt = T / N
+    u = np.exp(sigma * np.sqrt(dt))
+    d = 1 / u
+    p = (np.exp((r - q) * dt) - d) / (u - d)
+    disc = np.exp(-r * dt)
+    pu, pd = disc * p, disc * (1 - p)
+    theta = np.where(is_call, 1.0, -1.0)
+    can_exercise = _exercise_grid(exercise, exercise_times, T[0], N)
+
+    values = np.empty((N + 1, m))
+    scratch = np.empty((N + 1, m))
+    # spot at step N, node j: S u^j d^(N-j); one step back is a multiplication by u
+    spot = S * np.exp(np.log(u) * (2 * np.arange(N + 1)[:, None] - N))
+
+    def exercise_at(i):
+        if can_exercise is None or not can_exercise[i].any():
+            return
+        payoff = scratch[:i + 1]
+        np.subtract(spot[:i + 1], K, out=payoff)
+        payoff *= theta
+        if not can_exercise[i].all():
+            payoff[:, ~can_exercise[i]] = -np.inf
+        np.maximum(values[:i + 1], payoff, out=values[:i + 1])
+
+    if smoothing:
+        top = N - 1
+        spot[:N] *= u
+        values[:N] = bs_chain(spot[:N], K, dt, r, sigma, q=q, is_call=is_call)["price"]
+    else:
+        top = N
+        np.maximum(theta * (spot - K), 0.0, out=values)
+    exercise_at(top)
+
+    for i in range(top - 1, -1, -1):
+        np.multiply(values[1:i + 2], pu, out=scratch[:i + 1])
+        np.multiply(values[:i + 1], pd, out=values[:i + 1])
+        values[:i + 1] += scratch[:i + 1]
+        if can_exercise is not None:
+            spot[:i + 1] *= u
+            exercise_at(i)
+
+    return values[0].reshape(shape)
+
+
+def binomial_call(S, K, r, T, sigma, N):
+    return float(crr_lattice(S, K, T, r, sigma, N))
 
-    for i in range(N):
-        values = np.exp(-r*dt)*(p*values[1:]+(1-p)*values[:-1])
 
-    return values[0]
+if __name__ == "__main__":
+    Ns = np.arange(10, 400, 10)
+    crr = [binomial_call(100,100,0.05,1,0.2,n) for n in Ns]
+    bbsr = [float(crr_lattice(100,100,1,0.05,0.2,n,smoothing=True,richardson=True)) for n in Ns]
+    exact = float(bs_chain(100,100,1,0.05,0.2)["price"])
 
-Ns = range(5,200)
-prices = [binomial_call(100,100,0.05,1,0.2,n) for n in Ns]
+    plt.plot(Ns, crr, label="CRR")
+    plt.plot(Ns, bbsr, label="BBS + Richardson")
+    plt.axhline(exact, color="k", linestyle="--", label="Black-Scholes")
+    plt.title("Binomial Tree Convergence")
+    plt.xlabel("Steps")
+    plt.ylabel("Option Price")
+    plt.legend()
+    plt.show()
 
-plt.plot(Ns, prices)
-plt.title("Binomial Tree Convergence")
-plt.xlabel("Steps")
-plt.ylabel("Option Price")
-plt.show()
\ No newline at end of file
+    # American puts over a strike x maturity grid in one sweep
+    K = np.linspace(80, 120, 9)[:, None]
+    T = np.array([0.25, 0.5, 1.0])[None, :]
+    amer = crr_lattice(100, K, T, 0.05, 0.2, N=400, is_call=False, exercise="american",
+                       smoothing=True, richardson=True)
+    print("American put grid (rows: strikes, cols: maturities):")
+    print(np.round(amer, 4))
@@ -0,0 +1,133 @@
+import time
+
+import numpy as np
+from numpy.polynomial import laguerre, polynomial
+
+from binomial_tree import crr_lattice
+from heston_model import heston_paths
+from merton_jump import merton_paths
+
+BASES = {
+    "laguerre": laguerre.lagvander,
+    "polynomial": polynomial.polyvander,
+}
+
+
+def _design(S, K, basis, degree):
+    # spot in units of strike keeps the regression well conditioned
+    return BASES[basis](S / K, degree)
+
+
+def lsm_price(simulate, K, r, T, is_call=False, n_paths=100_000, chunk_size=25_000,
+              basis="laguerre", degree=3, rng=None, fresh_paths=True, n_regression_paths=None):
+    """
+    Longstaff-Schwartz least-squares Monte Carlo for American / Bermudan options.
+
+    simulate(n, rng) must return an (n, n_steps + 1) array of spot paths; every
+    time step after 0 is an exercise date. GBM, Heston (heston_paths) and
+    Merton (merton_paths) engines all fit this signature.
+
+    Pass 1 generates the regression set in chunks of `chunk_size`, keeping only
+    the spots (float32) and not the generator's internal state. Rolling back
+    over exercise dates, one least-squares fit per date regresses the
+    discounted continuation cash flows of the in-the-money paths on a
+    Laguerre or plain polynomial basis in S/K. Every fit needs all paths at
+    its date, so pass 1 still holds the full (n_paths, n_steps + 1) float32
+    spot matrix, about 4 * n_paths * (n_steps + 1) bytes (1 GB for 10^6
+    paths x 252 steps): chunk_size only bounds the simulator's temporaries
+    here. n_regression_paths (default n_paths) sizes pass 1 on its own, so
+    the regression set can stay small while the pricing pass grows.
+
+    Pass 2 (fresh_paths=True) prices n_paths new, independent paths with the
+    frozen exercise rule, chunk by chunk, which removes the in-sample
+    (foresight) bias of pass 1. Its memory is bounded by chunk_size.
+    Both passes floor the price at immediate exercise at t = 0.
+
+    Returns a dict: price, stderr, in_sample (pass-1 estimate) and
+    coefficients (n_steps + 1, degree + 1; NaN rows where nothing was fitted).
+    """
+    if basis not in BASES:
+        raise ValueError(f"basis must be one of {tuple(BASES)}, got {basis!r}")
+    rng = rng if rng is not None else np.random.default_rng()
+    sign = 1.0 if is_call else -1.0
+    n_fit = n_regression_paths or n_paths
+
+    chunks = []
+    for start in range(0, n_fit, chunk_size):
+        chunks.append(np.asarray(simulate(min(chunk_size, n_fit - start), rng), dtype=np.float32))
+    S = np.concatenate(chunks)
+    del chunks
+    n_steps = S.shape[1] - 1
+    df = np.exp(-r * T / n_steps)
+
+    coef = np.full((n_steps + 1, degree + 1), np.nan)
+    cash = np.maximum(sign * (S[:, -1] - K), 0.0)
+    for t in range(n_steps - 1, 0, -1):
+        cash *= df                                  # now valued at date t
+        spot = S[:, t].astype(np.float64)
+        exercise = np.maximum(sign * (spot - K), 0.0)
+        itm = np.flatnonzero(exercise > 0)
+        if itm.size <= degree + 1:
+            continue
+        X = _design(spot[itm], K, basis, degree)
+        coef[t] = np.linalg.lstsq(X, cash[itm], rcond=None)[0]
+        stop = exercise[itm] > X @ coef[t]
+        cash[itm[stop]] = exercise[itm[stop]]
+    cash *= df
+    intrinsic = max(sign * (float(S[0, 0]) - K), 0.0)
+    in_sample = max(cash.mean(), intrinsic)
+
+    if not fresh_paths:
+        return {
+            "price": in_sample,
+            "stderr": cash.std(ddof=1) / np.sqrt(n_fit),
+            "in_sample": in_sample,
+            "coefficients": coef,
+        }
+    del S, cash
+
+    total = total_sq = 0.0
+    discounts = df ** np.arange(n_steps + 1)
+    fitted = np.flatnonzero(~np.isnan(coef[:, 0]))
+    for start in range(0, n_paths, chunk_size):
+        paths = np.asarray(simulate(min(chunk_size, n_paths - start), rng), dtype=np.float64)
+        value = discounts[-1] * np.maximum(sign * (paths[:, -1] - K), 0.0)
+        undecided = np.ones(paths.shape[0], dtype=bool)
+        for t in fitted:
+            exercise = np.maximum(sign * (paths[:, t] - K), 0.0)
+            cont = _design(paths[:, t], K, basis, degree) @ coef[t]
+            stop = undecided & (exercise > 0) & (exercise > cont)
+            value[stop] = discounts[t] * exercise[stop]
+            undecided &= ~stop
+        total += value.sum()
+        total_sq += (value * value).sum()
+
+    mean = total / n_paths
+    var = (total_sq / n_paths - mean * mean) * n_paths / (n_paths - 1)
+    return {
+        "price": max(mean, intrinsic),
+        "stderr": np.sqrt(var / n_paths),
+        "in_sample": in_sample,
+        "coefficients": coef,
+    }
+
+
+if __name__ == "__main__":
+    S0, K, r, sigma, T = 100, 100, 0.05, 0.2, 1
+    n_steps = 50
+    rng = np.random.default_rng(7)
+
+    engines = {
+        # Merton with no jumps is plain GBM
+        "GBM": lambda n, g: merton_paths(S0, r, sigma, 0.0, 0.0, 0.0, T, n_steps, n, rng=g),
+        "Merton": lambda n, g: merton_paths(S0, r, sigma, 0.3, -0.2, 0.3, T, n_steps, n, rng=g),
+        "Heston": lambda n, g: heston_paths(S0, 0.04, 2, 0.04, 0.3, -0.7, r=r, T=T, n_steps=n_steps,
+                                            n_paths=n, rng=g)["S"],
+    }
+    ref = float(crr_lattice(S0, K, T, r, sigma, N=n_steps, is_call=False, exercise="american"))
+    print(f"Bermudan put ({n_steps} dates), CRR reference for GBM: {ref:.4f}")
+    for name, sim in engines.items():
+        t0 = time.perf_counter()
+        res = lsm_price(sim, K, r, T, is_call=False, n_paths=100_000, rng=rng)
+        print(f"  {name:7s} LSM: {res['price']:.4f} ± {res['stderr']:.4f} "
+              f"(in-sample {res['in_sample']:.4f})  [{time.perf_counter() - t0:.2f}s]")
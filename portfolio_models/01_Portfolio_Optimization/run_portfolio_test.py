@@ -10,7 +10,7 @@ data = loader.fetch_data()
 # Step 2: Prepare Daily Returns
 prices = pd.concat([data[t]['Close'] for t in data], axis=1)
 prices.columns = data.keys()
-returns = prices.pct_change().dropna()
+returns = loader.compute_returns(prices)
 
 # Step 3: Run Optimization
 optimizer = PortfolioOptimizer(returns)
@@ -1,19 +1,38 @@
-import yfinance as yf
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
+
+DATASETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "datasets")
 
 class DataLoader:
-    def __init__(self, tickers, start="2022-01-01", end=None, interval="1d"):
+    def __init__(self, tickers, start="2022-01-01", end=None, interval="1d", store=None,
+                 datasets_dir=DATASETS):
         if isinstance(tickers, str):
             tickers = [tickers]
         self.tickers = tickers
         self.start = start
         self.end = end
         self.interval = interval
+        self.store = store or PriceStore(interval=interval)
+        self.datasets_dir = datasets_dir
 
-    def fetch_data(self):
-        data = {}
+    def seed_from_datasets(self):
+        """Ingest the bundled daily yfinance CSVs (datasets/<TICKER>) into the store."""
+        if self.interval != "1d" or not self.datasets_dir:
+            return
         for t in self.tickers:
-            print(f"Fetching data for {t}...")
-            df = yf.download(t, start=self.start, end=self.end, interval=self.interval)
-            data[t] = df
-        return data
\ No newline at end of file
+            path = os.path.join(self.datasets_dir, t)
+            if os.path.isfile(path):
+                self.store.ingest_csv(path, ticker=t)
+
+    def fetch_data(self):
+        self.seed_from_datasets()
+        # served from the local price store; only unseen tickers hit the network
+        return self.store.load(self.tickers, start=self.start, end=self.end)
+
+    def compute_returns(self, prices_df):
+        # memoized per price version, shared with every model in this process
+        return returns_panel(prices_df).simple_frame()
\ No newline at end of file
@@ -13,14 +13,18 @@ Multi Factor Risk Model
 """
 
 import os
+import sys
 import numpy as np
 import pandas as pd
-import yfinance as yf
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.decomposition import PCA
 import statsmodels.api as sm
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
+
 # Config/ user inputs
 TICKERS = ['AAPL','MSFT','GOOGL']
 FACTOR_TICKERS = ['^GSPC','XLK']
@@ -35,27 +39,23 @@ os.makedirs(OUT_DIR,exist_ok = True)
 # Helper functions
 
 def download_close(tickers,start,end,interval='1d'):
-    out = {}
+    panel = PriceStore(interval=interval).load_panel(tickers, start=start, end=end, fill='ffill')
     for t in tickers:
-        print(f'Downloaning {t} ...')
-        df = yf.download(t, start = start, end = end, interval=interval, progress = False)
-        if df.empty:
+        if t not in panel.columns:
             raise RuntimeError(f"No data for {t}")
-        out[t] = df['Close']
-        out[t].name = t
-    return pd.concat(out.values(), axis = 1, keys=out.keys())
-def compute_returns(price_df):
-    return price_df.pct_change().dropna()
+    # columns in request order; the version keys the shared returns memo
+    return panel.to_frame().loc[:, tickers], f"{panel.version}|{','.join(tickers)}"
+def compute_returns(price_df, version=None):
+    return returns_panel(price_df, version=version).simple_frame()
 
 # -----------------------------
 # 1. Download prices & compute returns
 # -----------------------------
 all_tickers = list(set(TICKERS + FACTOR_TICKERS))
-prices = download_close(all_tickers, START_DATE, END_DATE, interval=FREQ)
-prices = prices.loc[:, all_tickers]  # ensure column order
+prices, price_version = download_close(all_tickers, START_DATE, END_DATE, interval=FREQ)
 prices.to_csv(os.path.join(OUT_DIR, "prices_snapshot.csv"))
 
-returns = compute_returns(prices)
+returns = compute_returns(prices, version=price_version)
 assets = returns[TICKERS]
 factors = returns[FACTOR_TICKERS]
 
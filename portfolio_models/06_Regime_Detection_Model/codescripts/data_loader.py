@@ -1,47 +1,48 @@
 # codescripts/data_loader.py
 
-import yfinance as yf
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+from market_data.returns import returns_panel
+from market_data.store import PriceStore
 
 class DataLoader:
-    def __init__(self, tickers, start, end=None, interval="1d"):
+    def __init__(self, tickers, start, end=None, interval="1d", store=None,
+                 fill="ffill", calendar=None):
         self.tickers = tickers
         self.start = start
         self.end = end
         self.interval = interval
+        self.store = store or PriceStore(interval=interval)
+        self.fill = fill            # see market_data.panel.FILL_POLICIES
+        self.calendar = calendar    # master trading calendar, default union of dates
+        self.prices = None
+        self.price_version = None   # store version of self.prices, the returns memo key
 
     def fetch_data(self):
-        close_prices = {}
+        panel = self.store.load_panel(
+            self.tickers,
+            start=self.start,
+            end=self.end,
+            calendar=self.calendar,
+            fill=self.fill,
+        )
 
         for t in self.tickers:
-            print(f"Fetching data for {t} ...")
-
-            df = yf.download(
-                t,
-                start=self.start,
-                end=self.end,
-                interval=self.interval,
-                progress=False,
-                auto_adjust=True
-            )
-
-            if df is None or df.empty:
+            if t not in panel.columns:
                 print(f"⚠️  No data returned for {t} — skipping.")
-                continue
-
-            # ✅ Ensure 'Close' becomes a Series with a proper index
-            series = pd.Series(df["Close"].values.ravel(), index=df.index, name=t)
-            close_prices[t] = series
 
-        if len(close_prices) == 0:
+        if len(panel.columns) == 0:
             raise ValueError("❌ No ticker returned valid data. Check tickers/date range/internet.")
 
-        # ✅ Convert dict of Series → DataFrame (safe)
-        df_all = pd.concat(close_prices, axis=1)
+        df_all = panel.to_frame()
 
-        # Clean dataset
+        # Clean dataset: once gaps are filled, only dates before a series starts stay incomplete
         df_all.dropna(inplace=True)
 
+        self.prices = df_all
+        self.price_version = f"{panel.version}|dropna"
         return df_all
 
     def compute_returns(self, prices_df):
@@ -49,5 +50,6 @@ class DataLoader:
             print("❌ No price data available to compute returns.")
             return None
 
-        returns = prices_df.pct_change().dropna()
-        return returns  # <-- this was missing
\ No newline at end of file
+        # memoized per price version, shared with every model in this process
+        version = self.price_version if prices_df is self.prices else None
+        return returns_panel(prices_df, version=version).simple_frame()
\ No newline at end of file